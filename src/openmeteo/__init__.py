@@ -84,7 +84,9 @@ See Also:
     - GisMeteo module for Russian forecasts with water temperature
 """
 
-from .client import OpenMeteoClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     OpenMeteoAPIError,
     OpenMeteoCacheError,
@@ -92,14 +94,6 @@ from .exceptions import (
     OpenMeteoError,
     OpenMeteoValidationError,
 )
-from .models import (
-    CurrentData,
-    CurrentResponse,
-    DailyData,
-    DailyResponse,
-    HourlyData,
-    HourlyResponse,
-)
 from .types import (
     ARCHIVE_BASE_URL,
     CACHE_SAFETY_MARGIN_HOURS,
@@ -107,10 +101,48 @@ from .types import (
     DEFAULT_TTL_MINUTES,
     FORECAST_BASE_URL,
     HISTORY_RECENT_DAYS,
+    MAX_CONCURRENT_REQUESTS,
     MAX_FORECAST_DAYS,
     TimeStep,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import OpenMeteoClient
+    from .models import (
+        CurrentData,
+        CurrentResponse,
+        DailyData,
+        DailyResponse,
+        HourlyData,
+        HourlyResponse,
+    )
+
+# The client and the pydantic models are imported on first access
+# (PEP 562), so `import openmeteo` stays cheap until they are used.
+_LAZY_ATTRS = {
+    "OpenMeteoClient": ".client",
+    "HourlyResponse": ".models",
+    "HourlyData": ".models",
+    "DailyResponse": ".models",
+    "DailyData": ".models",
+    "CurrentResponse": ".models",
+    "CurrentData": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "OpenMeteoClient",
     "TimeStep",
@@ -132,4 +164,5 @@ __all__ = [
     "MAX_FORECAST_DAYS",
     "CACHE_SAFETY_MARGIN_HOURS",
     "HISTORY_RECENT_DAYS",
+    "MAX_CONCURRENT_REQUESTS",
 ]
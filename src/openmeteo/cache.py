@@ -16,6 +16,8 @@ This module provides two caching strategies:
 Cache file naming:
     Files are named: `{coord_key}_{step}_{YYYY-MM}.json`
     Where coord_key is derived from lat/lon (e.g., "55p7500_37p6200").
+    With the msgpack format the suffix is `.msgpack` instead, and
+    zstd-compressed caches append `.zst` (e.g. `.json.zst`).
 
 Example:
     Cache files are managed automatically by OpenMeteoClient::
@@ -28,24 +30,127 @@ Example:
             data2 = await client.get_historical(55.75, 37.62, start, end)
 """
 
+import asyncio
+import contextlib
+import functools
 import json
 import logging
+import math
+import os
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 from datetime import timezone as dt_timezone
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Literal, Optional, Union
 
 from .models import DailyData, DailyResponse, HourlyData, HourlyResponse
 from .types import CACHE_SAFETY_MARGIN_HOURS, HISTORY_RECENT_DAYS, TimeStep
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - only without the orjson extra
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - only without the msgpack extra
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - only without the zstd extra
+    zstandard = None
+
+
 logger = logging.getLogger(__name__)
 
+# In-memory LRU key: (coord_key, step, month_key), the same identity as the
+# cache file name, so coordinates sharing a file share an entry.
+_MonthCacheKey = tuple[str, TimeStep, str]
+
+# How long the month index is trusted before the directory is rescanned
+# to pick up files written by other processes sharing the cache.
+_INDEX_TTL_SECONDS = 5.0
+
+CacheFormat = Literal["json", "msgpack"]
+
+TTLPolicy = Literal["fixed", "hourly_boundary", "adaptive"]
+
+
+def _msgpack_loads(raw: bytes) -> Any:
+    return msgpack.unpackb(raw, raw=False)
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+_FORMATS: dict[str, tuple[str, Callable[[bytes], Any], Callable[[Any], bytes]]] = {
+    "json": (".json", _json_loads, _json_dumps),
+    "msgpack": (".msgpack", _msgpack_loads, _msgpack_dumps),
+}
+"""Serialization backends by cache format: (file suffix, loads, dumps)."""
+
+
+_zstd_local = threading.local()
+"""Per-thread zstd contexts; they are reusable but not thread safe."""
+
+
+def _zstd_compress(raw: bytes) -> bytes:
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(raw)
+
+
+def _zstd_decompress(blob: bytes) -> bytes:
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(blob)
+
+
+def _rmtree(path: Union[str, Path]) -> None:
+    """Delete a directory tree, ignoring errors.
+
+    On POSIX systems this runs a single ``rm -rf``, which unlinks large
+    trees noticeably faster than shutil.rmtree's per-file Python loop.
+    Falls back to shutil.rmtree elsewhere or when rm is unavailable.
+
+    Args:
+        path: Directory to delete.
+
+    Example:
+        >>> _rmtree("/tmp/.historical.trash-1234")
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        subprocess.run(["rm", "-rf", "--", os.fspath(path)], check=False)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
 
 def _coord_key(lat: float, lon: float) -> str:
     """Generate a filesystem-safe key from coordinates.
 
     Converts coordinates to a string suitable for use in filenames,
-    replacing special characters that could cause issues.
+    replacing special characters that could cause issues. Results are
+    memoized since every cache operation derives the key again. The memo
+    is keyed on the sign of each coordinate too: -0.0 == 0.0, but -0.0
+    formats as "m0p0000", so the two must not share an entry.
 
     Args:
         lat: Latitude in decimal degrees.
@@ -60,6 +165,16 @@ def _coord_key(lat: float, lon: float) -> str:
         >>> _coord_key(-33.865, 151.21)
         'm33p8650_151p2100'
     """
+    return _format_coord_key(
+        lat, lon, math.copysign(1.0, lat), math.copysign(1.0, lon)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_coord_key(
+    lat: float, lon: float, lat_sign: float, lon_sign: float
+) -> str:
+    """Format a coordinate key; the signs only separate -0.0 from 0.0."""
     return f"{lat:.4f}_{lon:.4f}".replace("-", "m").replace(".", "p")
 
 
@@ -77,14 +192,15 @@ def _month_key(d: date) -> str:
         >>> _month_key(date(2024, 1, 15))
         '2024-01'
     """
-    return d.strftime("%Y-%m")
+    return f"{d.year:04d}-{d.month:02d}"
 
 
 def _parse_date(s: str) -> date:
     """Parse a date string from API response.
 
     Handles both date-only ("2024-01-15") and datetime
-    ("2024-01-15T12:00") formats.
+    ("2024-01-15T12:00") formats. OpenMeteo dates are fixed-width, so
+    only the leading YYYY-MM-DD is parsed.
 
     Args:
         s: Date or datetime string.
@@ -98,9 +214,7 @@ def _parse_date(s: str) -> date:
         >>> _parse_date("2024-01-15T12:00")
         datetime.date(2024, 1, 15)
     """
-    if "T" in s:
-        return datetime.fromisoformat(s).date()
-    return date.fromisoformat(s)
+    return date.fromisoformat(s[:10])
 
 
 class HistoricalCache:
@@ -118,8 +232,22 @@ class HistoricalCache:
         ├── 55p7500_37p6200_daily_2024-01.json
         └── ...
 
+    Parsed months are also kept in a small in-memory LRU keyed by file
+    modification time, so repeated loads of a hot month skip the disk
+    read and JSON decode entirely. The set of cached months is indexed
+    at startup and kept up to date by save_month, so lookups only
+    rescan the directory every few seconds, to see other processes' writes.
+
     Args:
         cache_dir: Directory to store cache files. Created if not exists.
+        format: On-disk serialization, "json" (default) or "msgpack".
+            msgpack stores floats in binary form, producing smaller files
+            that decode faster; it requires the msgpack extra.
+        fsync: Whether to fsync each file before renaming it into place.
+            Defaults to False; cached months can always be re-fetched.
+        compress: Whether to zstd-compress cache files (level 3). Monthly
+            payloads are highly repetitive and shrink several times over.
+            Requires the zstd extra. Defaults to False.
 
     Attributes:
         cache_dir: Path to the cache directory.
@@ -131,23 +259,126 @@ class HistoricalCache:
         >>> loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
     """
 
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(
+        self,
+        cache_dir: Path,
+        format: CacheFormat = "json",
+        fsync: bool = False,
+        compress: bool = False,
+    ) -> None:
         """Initialize the historical cache.
 
         Args:
             cache_dir: Directory to store cache files. Created if not exists.
+            format: On-disk serialization, "json" or "msgpack".
+                Defaults to "json".
+            fsync: Whether to fsync each file before renaming it into place.
+                Defaults to False.
+            compress: Whether to zstd-compress cache files. Defaults to False.
+
+        Raises:
+            ValueError: If format is not a supported cache format.
+            ImportError: If format is "msgpack" and msgpack is not installed,
+                or compress is True and zstandard is not installed.
 
         Example:
             >>> cache = HistoricalCache(Path("/tmp/openmeteo_cache"))
+            >>> packed = HistoricalCache(Path("/tmp/openmeteo_cache"), "msgpack")
         """
+        if format not in _FORMATS:
+            raise ValueError(
+                f"Unsupported cache format: {format!r}. Expected 'json' or 'msgpack'."
+            )
+        if format == "msgpack" and msgpack is None:  # pragma: no cover
+            raise ImportError(
+                "msgpack is required for the msgpack cache format. "
+                "Install it with: pip install msgpack"
+            )
+        if compress and zstandard is None:  # pragma: no cover
+            raise ImportError(
+                "zstandard is required for compressed caches. "
+                "Install it with: pip install zstandard"
+            )
+        self.format = format
+        self._fsync = fsync
+        suffix, loads, dumps = _FORMATS[format]
+        if compress:
+            self._suffix = suffix + ".zst"
+            self._loads = lambda raw: loads(_zstd_decompress(raw))
+            self._dumps = lambda obj: _zstd_compress(dumps(obj))
+        else:
+            self._suffix, self._loads, self._dumps = suffix, loads, dumps
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_str = str(cache_dir)
+        self._cutoff_day: Optional[date] = None
+        self._cutoff: tuple[int, int] = (0, 0)
+        # Values: (file mtime_ns, parsed data, month was final when loaded).
+        self._memory: OrderedDict[
+            _MonthCacheKey, tuple[int, dict[str, Any], bool]
+        ] = OrderedDict()
+        self._memory_max = 64
+        self._lock = threading.Lock()
+        self._index: dict[tuple[str, str], set[str]] = {}
+        self._index_built = 0.0
+        # Bumped by detach(); a rescan started before it is discarded.
+        self._index_generation = 0
+        # Months saved while a rescan is running, merged into its result.
+        self._index_pending: Optional[list[tuple[tuple[str, str], list[str]]]] = (
+            None
+        )
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Scan the cache directory once and index cached months.
+
+        Replaces the in-memory index mapping (coord_key, step) to the set
+        of month keys present on disk. The os.scandir pass runs without
+        holding the lock, so loads and saves in other threads are not
+        blocked by it; months saved meanwhile are merged into the result,
+        and the result is dropped if the cache was detached meanwhile.
+        """
+        with self._lock:
+            generation = self._index_generation
+            self._index_pending = []
+            self._index_built = time.monotonic()
+        index = self._scan_index()
+        with self._lock:
+            if generation != self._index_generation:
+                return
+            for key, months in self._index_pending or ():
+                index.setdefault(key, set()).update(months)
+            self._index_pending = None
+            self._index = index
+            self._index_built = time.monotonic()
+
+    def _index_stale(self) -> bool:
+        """Check whether the month index is due for a rescan."""
+        return time.monotonic() - self._index_built > _INDEX_TTL_SECONDS
+
+    def _scan_index(self) -> dict[tuple[str, str], set[str]]:
+        """List the cache directory into a (coord_key, step) -> months map."""
+        index: dict[tuple[str, str], set[str]] = {}
+        suffix = self._suffix
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(suffix):
+                    continue
+                parts = name[: -len(suffix)].rsplit("_", 2)
+                if len(parts) == 3:
+                    coord, step_value, month_key = parts
+                    index.setdefault((coord, step_value), set()).add(month_key)
+        return index
 
     def _get_cache_file(
         self, lat: float, lon: float, step: TimeStep, month_key: str
-    ) -> Path:
+    ) -> str:
         """Get the cache file path for a location, step, and month.
 
+        Returns a plain string rather than a Path: this runs for every
+        month of every request, and string joins avoid pathlib's overhead.
+
         Args:
             lat: Latitude in decimal degrees.
             lon: Longitude in decimal degrees.
@@ -159,10 +390,12 @@ class HistoricalCache:
 
         Example:
             >>> cache._get_cache_file(55.75, 37.62, TimeStep.HOURLY, "2024-01")
-            PosixPath('/cache/55p7500_37p6200_hourly_2024-01.json')
+            '/cache/55p7500_37p6200_hourly_2024-01.json'
         """
         coord = _coord_key(lat, lon)
-        return self.cache_dir / f"{coord}_{step.value}_{month_key}.json"
+        return os.path.join(
+            self._dir_str, f"{coord}_{step.value}_{month_key}{self._suffix}"
+        )
 
     def load_month(
         self, lat: float, lon: float, step: TimeStep, month_key: str
@@ -177,22 +410,89 @@ class HistoricalCache:
 
         Returns:
             Cached data as dict, or None if not found or on error.
+            The dict may be shared with the in-memory LRU and must not
+            be mutated by the caller.
+
+        Note:
+            Months older than the recent window are final: this cache
+            never rewrites them, and save_month/clear drop them from the
+            in-memory LRU. LRU entries loaded while their month was
+            already final are therefore served without stat-ing the file.
+            All other entries, including ones cached while the month was
+            still recent, are re-validated against the file's
+            modification time; an entry confirmed this way after its
+            month became final skips the check from then on.
 
         Example:
             >>> data = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
             >>> if data:
             ...     print(f"Loaded {len(data['hourly']['time'])} data points")
         """
+        key = (_coord_key(lat, lon), step, month_key)
+        final = not self.is_month_recent(month_key)
+        if final:
+            with self._lock:
+                hit = self._memory.get(key)
+                if hit is not None and hit[2]:
+                    self._memory.move_to_end(key)
+                    return hit[1]
+
         cache_file = self._get_cache_file(lat, lon, step, month_key)
-        if not cache_file.exists():
+        try:
+            mtime = os.stat(cache_file).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._memory.pop(key, None)
             return None
+
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None and hit[0] == mtime:
+                if final and not hit[2]:
+                    self._memory[key] = (mtime, hit[1], True)
+                self._memory.move_to_end(key)
+                return hit[1]
+
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            # Unbuffered FileIO.readall() reads in one syscall for typical
+            # months but, unlike a single os.read, loops on short reads.
+            with open(cache_file, "rb", buffering=0) as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                raw = f.readall()
+            data = self._loads(raw)
         except Exception as e:
             logger.warning(f"Failed to load cache {cache_file}: {e}")
             return None
 
+        with self._lock:
+            self._memory[key] = (mtime, data, final)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self._memory_max:
+                self._memory.popitem(last=False)
+        return data
+
+    async def aload_month(
+        self, lat: float, lon: float, step: TimeStep, month_key: str
+    ) -> Optional[dict[str, Any]]:
+        """Load cached data for a month without blocking the event loop.
+
+        Runs load_month in a worker thread, so several months can be read
+        and decoded concurrently with in-flight HTTP requests.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+            month_key: Month key in YYYY-MM format.
+
+        Returns:
+            Cached data as dict, or None if not found or on error.
+
+        Example:
+            >>> data = await cache.aload_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+        """
+        return await asyncio.to_thread(self.load_month, lat, lon, step, month_key)
+
     def save_month(
         self,
         lat: float,
@@ -203,6 +503,9 @@ class HistoricalCache:
     ) -> None:
         """Save data for a specific month to cache.
 
+        The file is written to a temporary sibling and atomically renamed
+        into place, so a crash mid-write never leaves a truncated month.
+
         Args:
             lat: Latitude in decimal degrees.
             lon: Longitude in decimal degrees.
@@ -216,19 +519,146 @@ class HistoricalCache:
             ...     {"hourly": {"time": [...], "temperature_2m": [...]}}
             ... )
         """
-        cache_file = self._get_cache_file(lat, lon, step, month_key)
+        self.save_months(lat, lon, step, {month_key: data})
+
+    def save_months(
+        self,
+        lat: float,
+        lon: float,
+        step: TimeStep,
+        items: dict[str, dict[str, Any]],
+    ) -> None:
+        """Save several months for one location and step in one pass.
+
+        Each month is written exactly like save_month does it, but the
+        in-memory LRU and index are updated under a single lock
+        acquisition. With fsync enabled, the directory is fsynced once at
+        the end to persist all renames.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+            items: API response data keyed by month key (YYYY-MM).
+
+        Example:
+            >>> cache.save_months(
+            ...     55.75, 37.62, TimeStep.HOURLY,
+            ...     {"2024-01": january, "2024-02": february},
+            ... )
+        """
+        with self._lock:
+            coord = _coord_key(lat, lon)
+            for month_key in items:
+                self._memory.pop((coord, step, month_key), None)
+
+        saved = [
+            month_key
+            for month_key, data in items.items()
+            if self._write_file(
+                self._get_cache_file(lat, lon, step, month_key), data
+            )
+        ]
+        if not saved:
+            return
+
+        if self._fsync:
+            with contextlib.suppress(OSError):
+                dir_fd = os.open(self._dir_str, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+        index_key = (_coord_key(lat, lon), step.value)
+        with self._lock:
+            self._index.setdefault(index_key, set()).update(saved)
+            if self._index_pending is not None:
+                self._index_pending.append((index_key, saved))
+
+    def _write_file(self, cache_file: str, data: dict[str, Any]) -> bool:
+        """Atomically write one serialized month to its cache file.
+
+        The temporary file name includes the process and thread ids, so
+        concurrent saves of the same month from worker threads never
+        share (and clobber) one temporary file.
+
+        Args:
+            cache_file: Destination path.
+            data: API response data to cache.
+
+        Returns:
+            True if the file was written, False on error (logged).
+        """
+        tmp_file = f"{cache_file}.tmp.{os.getpid()}.{threading.get_ident()}"
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(self._dumps(data))
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
             logger.debug(f"Saved cache to {cache_file}")
+            return True
         except Exception as e:
             logger.error(f"Failed to save cache {cache_file}: {e}")
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+            return False
+
+    async def asave_month(
+        self,
+        lat: float,
+        lon: float,
+        step: TimeStep,
+        month_key: str,
+        data: dict[str, Any],
+    ) -> None:
+        """Save data for a month without blocking the event loop.
+
+        Runs save_month in a worker thread.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+            month_key: Month key in YYYY-MM format.
+            data: API response data to cache.
+
+        Example:
+            >>> await cache.asave_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+        """
+        await asyncio.to_thread(self.save_month, lat, lon, step, month_key, data)
+
+    async def asave_months(
+        self,
+        lat: float,
+        lon: float,
+        step: TimeStep,
+        items: dict[str, dict[str, Any]],
+    ) -> None:
+        """Save several months without blocking the event loop.
+
+        Runs save_months in a single worker thread.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+            items: API response data keyed by month key (YYYY-MM).
+
+        Example:
+            >>> await cache.asave_months(55.75, 37.62, TimeStep.HOURLY, fetched)
+        """
+        await asyncio.to_thread(self.save_months, lat, lon, step, items)
 
     def get_cached_months(self, lat: float, lon: float, step: TimeStep) -> set[str]:
         """Get set of cached month keys for a location and step.
 
-        Scans the cache directory for files matching the location
-        and step pattern.
+        Served from the in-memory index, which is updated on every save.
+        The directory is rescanned at most every _INDEX_TTL_SECONDS so
+        months written by other processes sharing the cache are picked up.
+        Async callers should use aget_cached_months, which runs that
+        rescan in a worker thread.
 
         Args:
             lat: Latitude in decimal degrees.
@@ -242,14 +672,78 @@ class HistoricalCache:
             >>> months = cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY)
             >>> print(f"Have data for {len(months)} months")
         """
-        coord = _coord_key(lat, lon)
-        pattern = f"{coord}_{step.value}_*.json"
-        months = set()
-        for f in self.cache_dir.glob(pattern):
-            parts = f.stem.split("_")
-            if len(parts) >= 3:
-                months.add(parts[-1])
-        return months
+        if self._index_stale():
+            self._build_index()
+        with self._lock:
+            return set(self._index.get((_coord_key(lat, lon), step.value), ()))
+
+    async def aget_cached_months(
+        self, lat: float, lon: float, step: TimeStep
+    ) -> set[str]:
+        """Get cached month keys without blocking the event loop.
+
+        When the index is due for a rescan, the directory scan runs in a
+        worker thread; otherwise the answer comes straight from memory.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+
+        Returns:
+            Set of month keys (e.g., {"2024-01", "2024-02", ...}).
+
+        Example:
+            >>> months = await cache.aget_cached_months(55.75, 37.62, TimeStep.HOURLY)
+        """
+        if self._index_stale():
+            await asyncio.to_thread(self._build_index)
+        return self.get_cached_months(lat, lon, step)
+
+    def clear(self) -> None:
+        """Delete all cached historical data.
+
+        Removes the cache directory, recreates it empty and resets the
+        in-memory index and parsed-month LRU.
+
+        Example:
+            >>> cache.clear()  # Next requests fetch everything again
+        """
+        trash = self.detach()
+        if trash is not None:
+            _rmtree(trash)
+
+    def detach(self) -> Optional[Path]:
+        """Move all cached data out of the way without deleting it.
+
+        Renames the cache directory to a hidden sibling, recreates it
+        empty and resets the in-memory index and parsed-month LRU. The
+        rename is atomic and O(1) regardless of cache size, so callers
+        can delete the returned directory later, e.g. in the background.
+
+        Returns:
+            Path of the detached directory, or None if there was none.
+
+        Example:
+            >>> trash = cache.detach()
+            >>> if trash is not None:
+            ...     _rmtree(trash)
+        """
+        trash: Optional[Path] = self.cache_dir.with_name(
+            f".{self.cache_dir.name}.trash-{uuid.uuid4().hex}"
+        )
+        with self._lock:
+            try:
+                os.rename(self.cache_dir, trash)
+            except FileNotFoundError:
+                trash = None
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._memory.clear()
+            self._index.clear()
+            self._index_generation += 1
+            if self._index_pending is not None:
+                self._index_pending.clear()
+        return trash
 
     def is_month_recent(self, month_key: str) -> bool:
         """Check if a month is considered "recent" and should be re-fetched.
@@ -272,10 +766,29 @@ class HistoricalCache:
             >>> cache.is_month_recent("2023-01")  # Old data
             False
         """
+        return (int(month_key[:4]), int(month_key[5:7])) >= self._recent_cutoff()
+
+    def _recent_cutoff(self) -> tuple[int, int]:
+        """Get the first (year, month) considered recent.
+
+        Months whose first day falls on or after
+        ``today.replace(day=1) - HISTORY_RECENT_DAYS * 31 days`` are recent.
+
+        The result only changes at UTC midnight, so it is computed once
+        per day and reused.
+
+        Returns:
+            Tuple of (year, month) of the earliest recent month.
+        """
         today = datetime.now(tz=dt_timezone.utc).date()
-        month_date = datetime.strptime(month_key, "%Y-%m").date()
-        cutoff = today.replace(day=1) - timedelta(days=HISTORY_RECENT_DAYS * 31)
-        return month_date >= cutoff
+        if today != self._cutoff_day:
+            cutoff = today.replace(day=1) - timedelta(days=HISTORY_RECENT_DAYS * 31)
+            year, month0 = divmod(
+                cutoff.year * 12 + cutoff.month - 1 + (cutoff.day != 1), 12
+            )
+            self._cutoff = (year, month0 + 1)
+            self._cutoff_day = today
+        return self._cutoff
 
     def get_missing_months(
         self,
@@ -310,18 +823,68 @@ class HistoricalCache:
             >>> print(f"Need to fetch {len(missing)} months")
         """
         cached = self.get_cached_months(lat, lon, step)
-        needed = set()
+        cutoff = self._recent_cutoff()
+        needed = []
+
+        y, m = start_date.year, start_date.month
+        end = (end_date.year, end_date.month)
+
+        while (y, m) <= end:
+            month_key = f"{y:04d}-{m:02d}"
+            if month_key not in cached or (y, m) >= cutoff:
+                needed.append(month_key)
+            m += 1
+            if m == 13:
+                m = 1
+                y += 1
+
+        return needed
+
+    async def aget_missing_months(
+        self,
+        lat: float,
+        lon: float,
+        step: TimeStep,
+        start_date: date,
+        end_date: date,
+    ) -> list[str]:
+        """Get months that need to be fetched without blocking the event loop.
+
+        Like aget_cached_months, runs a due index rescan in a worker thread
+        before computing the result with get_missing_months.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+            start_date: Start of requested date range.
+            end_date: End of requested date range.
+
+        Returns:
+            Sorted list of month keys to fetch.
+
+        Example:
+            >>> missing = await cache.aget_missing_months(
+            ...     55.75, 37.62, TimeStep.HOURLY,
+            ...     date(2024, 1, 1), date(2024, 3, 31)
+            ... )
+        """
+        if self._index_stale():
+            await asyncio.to_thread(self._build_index)
+        return self.get_missing_months(lat, lon, step, start_date, end_date)
+
 
-        current = start_date.replace(day=1)
-        end_month = end_date.replace(day=1)
+class _ForecastEntry:
+    """A single cached forecast together with its validity metadata."""
 
-        while current <= end_month:
-            month_key = _month_key(current)
-            if month_key not in cached or self.is_month_recent(month_key):
-                needed.add(month_key)
-            current = (current + timedelta(days=32)).replace(day=1)
+    __slots__ = ("data", "dump", "deadline")
 
-        return sorted(needed)
+    def __init__(
+        self, data: Union[HourlyResponse, DailyResponse], deadline: float
+    ) -> None:
+        self.data = data
+        self.dump: Optional[dict[str, Any]] = None
+        self.deadline = deadline
 
 
 class ForecastCache:
@@ -333,8 +896,21 @@ class ForecastCache:
     2. Current time is within CACHE_SAFETY_MARGIN_HOURS of the last
        forecast point (data is becoming stale)
 
+    How the TTL is applied depends on ttl_policy:
+
+    - "fixed": entries expire ttl_minutes after they were fetched.
+    - "hourly_boundary": entries expire when the UTC hour rolls over,
+      matching the hourly update cadence of the forecast models.
+    - "adaptive": the TTL is halved for short-range forecasts (1 day)
+      and doubled for long-range ones (10+ days).
+
+    The cache is bounded: once it holds maxsize entries, the least
+    recently used one is evicted.
+
     Args:
         ttl_minutes: Cache time-to-live in minutes. Defaults to 60.
+        maxsize: Maximum number of cached forecasts. Defaults to 256.
+        ttl_policy: How entry lifetimes are computed. Defaults to "fixed".
 
     Example:
         >>> cache = ForecastCache(ttl_minutes=30)
@@ -343,19 +919,34 @@ class ForecastCache:
         ...     data = cache.get(55.75, 37.62, TimeStep.HOURLY)
     """
 
-    def __init__(self, ttl_minutes: int = 60) -> None:
+    def __init__(
+        self,
+        ttl_minutes: int = 60,
+        maxsize: int = 256,
+        ttl_policy: TTLPolicy = "fixed",
+    ) -> None:
         """Initialize the forecast cache.
 
         Args:
             ttl_minutes: Cache time-to-live in minutes. Defaults to 60.
+            maxsize: Maximum number of cached forecasts. Defaults to 256.
+            ttl_policy: "fixed", "hourly_boundary" or "adaptive".
+                Defaults to "fixed".
+
+        Raises:
+            ValueError: If ttl_policy is not supported.
 
         Example:
-            >>> cache = ForecastCache(ttl_minutes=30)
+            >>> cache = ForecastCache(ttl_minutes=30, ttl_policy="adaptive")
         """
+        if ttl_policy not in ("fixed", "hourly_boundary", "adaptive"):
+            raise ValueError(f"Unsupported TTL policy: {ttl_policy!r}")
         self._ttl = timedelta(minutes=ttl_minutes)
-        self._cache: dict[tuple[float, float, TimeStep], dict[str, Any]] = {}
-        self._fetched_at: dict[tuple[float, float, TimeStep], datetime] = {}
-        self._last_forecast_time: dict[tuple[float, float, TimeStep], datetime] = {}
+        self._ttl_policy = ttl_policy
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[float, float, TimeStep], _ForecastEntry] = (
+            OrderedDict()
+        )
 
     def _get_last_time(self, data: Any) -> datetime:
         """Extract the timestamp of the last forecast point.
@@ -371,27 +962,17 @@ class ForecastCache:
             >>> last_time = cache._get_last_time(response)
             >>> print(f"Forecast ends at {last_time}")
         """
-        if hasattr(data, "hourly"):
-            hourly = data.hourly
-            if hasattr(hourly, "time") and hourly.time:
-                last = hourly.time[-1]
-                if "T" in last:
-                    dt = datetime.fromisoformat(last)
+        for attr in ("hourly", "daily"):
+            times = getattr(getattr(data, attr, None), "time", None)
+            if times:
+                day, _, clock = times[-1].partition("T")
+                if clock:
+                    dt = datetime.fromisoformat(times[-1])
                     if dt.tzinfo is None:
                         dt = dt.replace(tzinfo=dt_timezone.utc)
                     return dt
                 return datetime.combine(
-                    date.fromisoformat(last),
-                    datetime.min.time(),
-                    tzinfo=dt_timezone.utc,
-                )
-
-        if hasattr(data, "daily"):
-            daily = data.daily
-            if hasattr(daily, "time") and daily.time:
-                last = daily.time[-1]
-                return datetime.combine(
-                    date.fromisoformat(last),
+                    date.fromisoformat(day),
                     datetime.min.time(),
                     tzinfo=dt_timezone.utc,
                 )
@@ -399,7 +980,11 @@ class ForecastCache:
         return datetime.now(tz=dt_timezone.utc)
 
     def get(self, lat: float, lon: float, step: TimeStep) -> Optional[dict[str, Any]]:
-        """Get cached forecast data.
+        """Get cached forecast data as a dict.
+
+        The response is serialized with model_dump() on first access and
+        the result is memoized, so forecasts that are never read as dicts
+        never pay for the dump.
 
         Args:
             lat: Latitude in decimal degrees.
@@ -414,8 +999,53 @@ class ForecastCache:
             >>> if data:
             ...     print(f"Have cached data with {len(data['hourly']['time'])} points")
         """
-        key = (lat, lon, step)
-        return self._cache.get(key)
+        entry = self._entries.get((lat, lon, step))
+        if entry is None:
+            return None
+        if entry.dump is None:
+            entry.dump = entry.data.model_dump()
+        return entry.dump
+
+    def get_model(
+        self, lat: float, lon: float, step: TimeStep
+    ) -> Optional[Union[HourlyResponse, DailyResponse]]:
+        """Get the cached forecast response object.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+            step: Time step (HOURLY or DAILY).
+
+        Returns:
+            The cached response as stored by set(), or None if not cached.
+
+        Example:
+            >>> response = cache.get_model(55.75, 37.62, TimeStep.HOURLY)
+        """
+        entry = self._entries.get((lat, lon, step))
+        return entry.data if entry is not None else None
+
+    def _expires_at(self, fetched: datetime, days: Optional[int]) -> datetime:
+        """Compute when an entry fetched at the given time stops being fresh.
+
+        Args:
+            fetched: When the forecast was fetched (UTC).
+            days: Number of forecast days requested, if known.
+
+        Returns:
+            Expiry time according to the TTL policy (UTC).
+        """
+        if self._ttl_policy == "hourly_boundary":
+            return fetched.replace(minute=0, second=0, microsecond=0) + timedelta(
+                hours=1
+            )
+        ttl = self._ttl
+        if self._ttl_policy == "adaptive" and days is not None:
+            if days <= 1:
+                ttl = ttl / 2
+            elif days >= 10:
+                ttl = ttl * 2
+        return fetched + ttl
 
     def set(
         self,
@@ -423,23 +1053,36 @@ class ForecastCache:
         lon: float,
         step: TimeStep,
         data: Union[HourlyResponse, DailyResponse],
+        days: Optional[int] = None,
     ) -> None:
         """Store forecast data in cache.
 
+        The expiry time is computed once here, as the earlier of the TTL
+        policy's deadline and CACHE_SAFETY_MARGIN_HOURS before the last
+        forecast point, and stored as a time.monotonic() deadline.
+
         Args:
             lat: Latitude in decimal degrees.
             lon: Longitude in decimal degrees.
             step: Time step (HOURLY or DAILY).
             data: Response object to cache.
+            days: Number of forecast days requested. Used by the
+                "adaptive" TTL policy. Defaults to None.
 
         Example:
-            >>> cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+            >>> cache.set(55.75, 37.62, TimeStep.HOURLY, response, days=7)
         """
         key = (lat, lon, step)
         now = datetime.now(tz=dt_timezone.utc)
-        self._cache[key] = data.model_dump()
-        self._fetched_at[key] = now
-        self._last_forecast_time[key] = self._get_last_time(data)
+        expires = min(
+            self._expires_at(now, days),
+            self._get_last_time(data) - timedelta(hours=CACHE_SAFETY_MARGIN_HOURS),
+        )
+        deadline = time.monotonic() + (expires - now).total_seconds()
+        self._entries[key] = _ForecastEntry(data, deadline)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
 
     def is_valid(self, lat: float, lon: float, step: TimeStep) -> bool:
         """Check if cached data is still valid.
@@ -448,6 +1091,9 @@ class ForecastCache:
         1. TTL check: Has enough time passed since fetch?
         2. Freshness check: Are we too close to the forecast's end?
 
+        Both are folded into the monotonic deadline computed by set(), so
+        this is a single float comparison with no datetime construction.
+
         Args:
             lat: Latitude in decimal degrees.
             lon: Longitude in decimal degrees.
@@ -464,23 +1110,12 @@ class ForecastCache:
             ...     pass
         """
         key = (lat, lon, step)
-        if key not in self._cache:
-            return False
-
-        now = datetime.now(tz=dt_timezone.utc)
-        fetched = self._fetched_at.get(key)
-        last_time = self._last_forecast_time.get(key)
-
-        if not fetched or not last_time:
-            return False
-
-        if (now - fetched) > self._ttl:
-            return False
-
-        if now > (last_time - timedelta(hours=CACHE_SAFETY_MARGIN_HOURS)):
+        entry = self._entries.get(key)
+        if entry is None:
             return False
+        self._entries.move_to_end(key)
 
-        return True
+        return time.monotonic() <= entry.deadline
 
     def clear(self) -> None:
         """Clear all cached forecast data.
@@ -490,6 +1125,4 @@ class ForecastCache:
         Example:
             >>> cache.clear()  # Force fresh fetches on next requests
         """
-        self._cache.clear()
-        self._fetched_at.clear()
-        self._last_forecast_time.clear()
+        self._entries.clear()
@@ -38,15 +38,27 @@ Example:
         asyncio.run(main())
 """
 
+import asyncio
+import calendar
 import logging
-from datetime import date, datetime, timedelta
+import random
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
 from datetime import timezone as dt_timezone
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Sequence, Union
 
 import httpx
 
-from .cache import ForecastCache, HistoricalCache, _parse_date
+from .cache import (
+    CacheFormat,
+    ForecastCache,
+    HistoricalCache,
+    TTLPolicy,
+    _json_loads,
+    _rmtree,
+)
 from .exceptions import (
     OpenMeteoAPIError,
     OpenMeteoConnectionError,
@@ -62,20 +74,40 @@ from .models import (
     HourlyData,
     HourlyResponse,
     HourlyUnits,
+    _build_model,
 )
 from .types import (
     ARCHIVE_BASE_URL,
     DEFAULT_FORECAST_DAYS,
     DEFAULT_TTL_MINUTES,
     FORECAST_BASE_URL,
+    MAX_CONCURRENT_REQUESTS,
     MAX_FORECAST_DAYS,
     TimeStep,
 )
 
 logger = logging.getLogger(__name__)
 
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+"""HTTP statuses treated as transient and retried with backoff."""
+
+_MAX_RETRY_AFTER_SECONDS = 60.0
+"""Upper bound on a single wait requested through a Retry-After header."""
+
+_CACHE_COORD_PRECISION = 2
+"""Decimal places of coordinates used as forecast cache keys.
+
+OpenMeteo snaps requests to its model grid, so points closer than about
+a kilometre share a cached forecast.
+"""
+
+try:
+    _USER_AGENT = f"openmeteo-py-df/{version('openmeteo-py-df')}"
+except PackageNotFoundError:  # pragma: no cover - running from a source tree
+    _USER_AGENT = "openmeteo-py-df"
 
-HOURLY_VARIABLES = [
+
+HOURLY_VARIABLES = (
     "temperature_2m",
     "relative_humidity_2m",
     "dew_point_2m",
@@ -101,8 +133,8 @@ HOURLY_VARIABLES = [
     "vapour_pressure_deficit",
     "visibility",
     "is_day",
-]
-"""list[str]: Default hourly weather variables to fetch.
+)
+"""tuple[str, ...]: Default hourly weather variables to fetch.
 
 These variables are requested when calling get_historical() or
 get_forecast() with step=TimeStep.HOURLY and no custom variables.
@@ -120,7 +152,7 @@ Includes:
     - Weather code: WMO classification
 """
 
-DAILY_VARIABLES = [
+DAILY_VARIABLES = (
     "temperature_2m_max",
     "temperature_2m_min",
     "temperature_2m_mean",
@@ -142,8 +174,8 @@ DAILY_VARIABLES = [
     "shortwave_radiation_sum",
     "et0_fao_evapotranspiration",
     "uv_index_max",
-]
-"""list[str]: Default daily weather variables to fetch.
+)
+"""tuple[str, ...]: Default daily weather variables to fetch.
 
 These variables are requested when calling get_historical() or
 get_forecast() with step=TimeStep.DAILY and no custom variables.
@@ -158,7 +190,7 @@ Includes:
     - Weather code: WMO classification
 """
 
-CURRENT_VARIABLES = [
+CURRENT_VARIABLES = (
     "temperature_2m",
     "relative_humidity_2m",
     "dew_point_2m",
@@ -173,8 +205,8 @@ CURRENT_VARIABLES = [
     "wind_speed_10m",
     "wind_direction_10m",
     "wind_gusts_10m",
-]
-"""list[str]: Default current weather variables to fetch.
+)
+"""tuple[str, ...]: Default current weather variables to fetch.
 
 These variables are requested when calling get_current().
 
@@ -188,6 +220,43 @@ Includes:
     - Weather code: WMO classification
 """
 
+_VARIABLES_CSV = {
+    TimeStep.HOURLY: ",".join(HOURLY_VARIABLES),
+    TimeStep.DAILY: ",".join(DAILY_VARIABLES),
+}
+"""Default variables per time step, pre-joined for the query string."""
+
+_CURRENT_VARIABLES_CSV = ",".join(CURRENT_VARIABLES)
+
+
+def _iter_months(start: date, end: date) -> Iterator[tuple[str, date, date]]:
+    """Iterate over the calendar months overlapping a date range.
+
+    Args:
+        start: First date of the range.
+        end: Last date of the range.
+
+    Yields:
+        Tuples of (month key in YYYY-MM format, first day, last day).
+
+    Example:
+        >>> list(_iter_months(date(2024, 1, 15), date(2024, 2, 10)))
+        [('2024-01', datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)),
+         ('2024-02', datetime.date(2024, 2, 1), datetime.date(2024, 2, 29))]
+    """
+    y, m = start.year, start.month
+    end_y, end_m = end.year, end.month
+    while (y, m) <= (end_y, end_m):
+        yield (
+            f"{y:04d}-{m:02d}",
+            date(y, m, 1),
+            date(y, m, calendar.monthrange(y, m)[1]),
+        )
+        if m == 12:
+            y, m = y + 1, 1
+        else:
+            m += 1
+
 
 class OpenMeteoClient:
     """Async client for OpenMeteo weather API.
@@ -207,11 +276,33 @@ class OpenMeteoClient:
         cache_dir: Directory for historical data cache. Defaults to
             ~/.cache/openmeteo/historical.
         timeout: HTTP request timeout in seconds. Defaults to 30.0.
+        cache_format: On-disk format of the historical cache, "json" or
+            "msgpack". Defaults to "json".
+        cache_compress: Whether to zstd-compress historical cache files.
+            Defaults to False.
+        max_connections: Maximum number of concurrent HTTP connections.
+            Defaults to 100.
+        max_keepalive: Maximum number of idle connections kept alive.
+            Defaults to 20.
+        http2: Whether to use HTTP/2. Requires the ``http2`` extra.
+            Defaults to False.
+        max_concurrent_requests: Maximum number of historical months
+            fetched in parallel. Defaults to 8.
+        max_retries: Retries for transient HTTP errors. Defaults to 3.
+        backoff_base: Base backoff delay in seconds. Defaults to 0.5.
+        ttl_policy: Forecast cache TTL policy. Defaults to "fixed".
 
     Attributes:
         _ttl: Forecast cache TTL in minutes.
         _timeout: HTTP timeout in seconds.
+        _limits: Connection pool limits for the HTTP client.
+        _http2: Whether the HTTP client negotiates HTTP/2.
+        _max_concurrent_requests: Bound on parallel archive requests.
+        _max_retries: Retries for transient HTTP errors.
+        _backoff_base: Base backoff delay in seconds.
         _client: Lazy-initialized httpx.AsyncClient.
+        _inflight: In-flight requests by (url, params), for coalescing.
+        _cleanup_tasks: Background deletions of cleared cache directories.
         _historical_cache: File-based cache for historical data.
         _forecast_cache: In-memory cache for forecast data.
 
@@ -245,6 +336,15 @@ class OpenMeteoClient:
         ttl_minutes: int = DEFAULT_TTL_MINUTES,
         cache_dir: Optional[Path] = None,
         timeout: float = 30.0,
+        cache_format: CacheFormat = "json",
+        cache_compress: bool = False,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        http2: bool = False,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        ttl_policy: TTLPolicy = "fixed",
     ) -> None:
         """Initialize the OpenMeteo client.
 
@@ -253,6 +353,27 @@ class OpenMeteoClient:
             cache_dir: Directory for historical data cache. Defaults to
                 ~/.cache/openmeteo/historical.
             timeout: HTTP request timeout in seconds. Defaults to 30.0.
+            cache_format: On-disk format of the historical cache, "json" or
+                "msgpack". Defaults to "json".
+            cache_compress: Whether to zstd-compress historical cache files.
+                Defaults to False.
+            max_connections: Maximum number of concurrent HTTP connections.
+                Defaults to 100.
+            max_keepalive: Maximum number of idle connections kept alive
+                for reuse. Defaults to 20.
+            http2: Whether to negotiate HTTP/2, multiplexing requests over
+                a single connection. Requires the ``http2`` extra.
+                Defaults to False.
+            max_concurrent_requests: Maximum number of historical months
+                fetched in parallel. Defaults to 8.
+            max_retries: How many times a request failing with HTTP 429,
+                502, 503 or 504 is retried. Defaults to 3.
+            backoff_base: Base delay in seconds for exponential backoff
+                between retries. Defaults to 0.5.
+            ttl_policy: How forecast cache lifetimes are computed: "fixed"
+                (ttl_minutes after fetch), "hourly_boundary" (until the UTC
+                hour rolls over) or "adaptive" (ttl_minutes scaled by the
+                forecast range). Defaults to "fixed".
 
         Example:
             >>> client = OpenMeteoClient()
@@ -264,12 +385,27 @@ class OpenMeteoClient:
         """
         self._ttl = ttl_minutes
         self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=30.0,
+        )
+        self._http2 = http2
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
         self._client: Optional[httpx.AsyncClient] = None
+        self._cleanup_tasks: set[asyncio.Task[None]] = set()
+        self._inflight: dict[
+            tuple[str, tuple[tuple[str, Any], ...]], asyncio.Task[dict[str, Any]]
+        ] = {}
 
         if cache_dir is None:
             cache_dir = Path.home() / ".cache" / "openmeteo"
-        self._historical_cache = HistoricalCache(cache_dir / "historical")
-        self._forecast_cache = ForecastCache(ttl_minutes)
+        self._historical_cache = HistoricalCache(
+            cache_dir / "historical", cache_format, compress=cache_compress
+        )
+        self._forecast_cache = ForecastCache(ttl_minutes, ttl_policy=ttl_policy)
 
     async def __aenter__(self) -> "OpenMeteoClient":
         """Enter async context manager.
@@ -312,7 +448,12 @@ class OpenMeteoClient:
             >>> client = await self._ensure_client()
         """
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self._timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                headers={"user-agent": _USER_AGENT},
+            )
         return self._client
 
     async def close(self) -> None:
@@ -328,6 +469,8 @@ class OpenMeteoClient:
             ... finally:
             ...     await client.close()
         """
+        if self._cleanup_tasks:
+            await asyncio.gather(*self._cleanup_tasks)
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -405,14 +548,19 @@ class OpenMeteoClient:
                 f"days must be in range [1, {MAX_FORECAST_DAYS}], got {days}"
             )
 
-    async def _fetch(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Fetch data from the API.
+    async def _fetch(
+        self, url: str, params: Union[dict[str, Any], httpx.QueryParams]
+    ) -> dict[str, Any]:
+        """Fetch data from the API, coalescing identical concurrent requests.
 
-        Makes an HTTP GET request and handles errors.
+        Concurrent callers asking for the same URL and parameters share a
+        single in-flight HTTP request and receive the same result (or
+        exception). The returned dict may therefore be shared and must not
+        be mutated.
 
         Args:
             url: API URL to fetch from.
-            params: Query parameters.
+            params: Query parameters, as a dict or prebuilt httpx.QueryParams.
 
         Returns:
             Parsed JSON response as dict.
@@ -428,17 +576,73 @@ class OpenMeteoClient:
             ...     {"latitude": 55.75, "longitude": 37.62}
             ... )
         """
-        client = await self._ensure_client()
+        key = (url, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(url, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight_done(key, t))
+        # Shield so that one cancelled caller does not cancel the request
+        # for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    def _inflight_done(
+        self, key: tuple[str, tuple[tuple[str, Any], ...]], task: asyncio.Task
+    ) -> None:
+        """Forget a finished in-flight request.
+
+        Also marks the task's exception as retrieved, so a request whose
+        callers were all cancelled does not log a warning.
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(
+        self, url: str, params: Union[dict[str, Any], httpx.QueryParams]
+    ) -> dict[str, Any]:
+        """Perform a single API request.
+
+        Makes an HTTP GET request and handles errors.
+
+        Args:
+            url: API URL to fetch from.
+            params: Query parameters, as a dict or prebuilt httpx.QueryParams.
+
+        Returns:
+            Parsed JSON response as dict.
+
+        Raises:
+            OpenMeteoConnectionError: If HTTP request fails.
+            OpenMeteoAPIError: If API returns an error response.
 
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise OpenMeteoConnectionError(f"HTTP error: {e}") from e
-        except httpx.RequestError as e:
-            raise OpenMeteoConnectionError(f"Request error: {e}") from e
+        Example:
+            >>> # Internal method - called through _fetch()
+            >>> data = await self._request(
+            ...     "https://api.open-meteo.com/v1/forecast",
+            ...     {"latitude": 55.75, "longitude": 37.62}
+            ... )
+        """
+        client = await self._ensure_client()
 
-        data = response.json()
+        attempt = 0
+        while True:
+            try:
+                response = await client.get(url, params=params)
+                response.raise_for_status()
+                break
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status not in _RETRY_STATUSES or attempt >= self._max_retries:
+                    raise OpenMeteoConnectionError(f"HTTP error: {e}") from e
+                delay = self._retry_delay(attempt, e.response)
+                logger.debug(f"HTTP {status}, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+            except httpx.RequestError as e:
+                raise OpenMeteoConnectionError(f"Request error: {e}") from e
+
+        data = _json_loads(response.content)
 
         if data.get("error"):
             error = ErrorResponse(**data)
@@ -446,6 +650,42 @@ class OpenMeteoClient:
 
         return data
 
+    def _retry_delay(self, attempt: int, response: httpx.Response) -> float:
+        """Compute how long to wait before retrying a failed request.
+
+        Uses jittered exponential backoff, but waits longer when the server
+        asks for it in a numeric Retry-After header. The requested wait is
+        capped at the largest backoff step (backoff_base * 2**max_retries)
+        and at _MAX_RETRY_AFTER_SECONDS, so a proxy answering e.g.
+        "Retry-After: 3600" cannot stall a call for an hour per retry.
+
+        Args:
+            attempt: Zero-based number of the failed attempt.
+            response: The failed HTTP response.
+
+        Returns:
+            Delay in seconds.
+
+        Example:
+            >>> self._retry_delay(0, response)  # ~0.5s with default backoff
+            0.61
+        """
+        delay = self._backoff_base * 2**attempt + random.uniform(0, 0.25)
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                delay = max(
+                    delay,
+                    min(
+                        float(retry_after),
+                        self._backoff_base * 2**self._max_retries,
+                        _MAX_RETRY_AFTER_SECONDS,
+                    ),
+                )
+            except ValueError:
+                pass
+        return delay
+
     def _merge_data(
         self,
         existing: Optional[dict[str, Any]],
@@ -457,6 +697,16 @@ class OpenMeteoClient:
         Combines data from multiple API calls, avoiding duplicates
         based on timestamps. Used when fetching multiple months.
 
+        Both time lists are sorted, so they are merged in a single
+        two-pointer pass that keeps the result sorted; when a timestamp
+        appears in both, the existing value wins. If the ranges do not
+        overlap (all new timestamps come after, or all before, the
+        existing ones), the lists are simply concatenated in order.
+        Variables present on only one side are padded with None so every
+        list stays aligned with the time list. Neither input is mutated,
+        and the result never shares variable lists with either input, so
+        lists handed out in a response cannot corrupt cached months.
+
         Args:
             existing: Existing cached data, or None.
             new: New data to merge.
@@ -472,33 +722,58 @@ class OpenMeteoClient:
             ...     TimeStep.HOURLY
             ... )
         """
-        if existing is None:
-            return new
-
         data_key = "hourly" if step == TimeStep.HOURLY else "daily"
         times_key = "time"
 
-        existing_times = set(existing.get(data_key, {}).get(times_key, []))
+        if existing is None:
+            copied = dict(new)
+            copied[data_key] = {
+                key: list(values) if isinstance(values, list) else values
+                for key, values in new.get(data_key, {}).items()
+            }
+            return copied
+
+        old_data = existing.get(data_key, {})
         new_data = new.get(data_key, {})
-        new_times = new_data.get(times_key, [])
+        old_times = old_data.get(times_key) or []
+        new_times = new_data.get(times_key) or []
+        n_old, n_new = len(old_times), len(new_times)
+
+        new_first = overlap = False
+        if n_old and n_new:
+            new_first = new_times[-1] < old_times[0]
+            overlap = not new_first and old_times[-1] >= new_times[0]
+
+        picks: Optional[list[tuple[bool, int]]] = None
+        if overlap:
+            picks = []
+            i = j = 0
+            while i < n_old and j < n_new:
+                a, b = old_times[i], new_times[j]
+                if a <= b:
+                    picks.append((False, i))
+                    i += 1
+                    if a == b:
+                        j += 1
+                else:
+                    picks.append((True, j))
+                    j += 1
+            picks.extend((False, k) for k in range(i, n_old))
+            picks.extend((True, k) for k in range(j, n_new))
 
         merged = dict(existing)
-        merged_data = dict(merged.get(data_key, {}))
-
-        for key, values in new_data.items():
-            if key not in merged_data:
-                merged_data[key] = values
+        merged_data = dict(old_data)
+        for key in {**old_data, **new_data}:
+            old_vals = old_data.get(key) or [None] * n_old
+            new_vals = new_data.get(key) or [None] * n_new
+            if new_first:
+                merged_data[key] = new_vals + old_vals
+            elif picks is None:
+                merged_data[key] = old_vals + new_vals
             else:
-                existing_vals = merged_data[key] or []
-                new_vals = values or []
-
-                merged_vals = list(existing_vals)
-                for i, t in enumerate(new_times):
-                    if t not in existing_times:
-                        if i < len(new_vals):
-                            merged_vals.append(new_vals[i])
-
-                merged_data[key] = merged_vals
+                merged_data[key] = [
+                    new_vals[k] if from_new else old_vals[k] for from_new, k in picks
+                ]
 
         merged[data_key] = merged_data
         return merged
@@ -545,13 +820,12 @@ class OpenMeteoClient:
             start_str = f"{start_str}T00:00"
             end_str = f"{end_str}T23:59"
 
-        indices = []
-        for i, t in enumerate(time_list):
-            t_date = t[:10] if step == TimeStep.DAILY else t[:16]
-            if start_str <= t <= end_str:
-                indices.append(i)
+        # Times are ISO strings in chronological order, so a lexicographic
+        # binary search finds the range and each variable is a plain slice.
+        lo = bisect_left(time_list, start_str)
+        hi = bisect_right(time_list, end_str)
 
-        if not indices:
+        if lo >= hi:
             return data
 
         trimmed = dict(data)
@@ -559,7 +833,7 @@ class OpenMeteoClient:
 
         for key, values in trimmed_data.items():
             if isinstance(values, list):
-                trimmed_data[key] = [values[i] for i in indices if i < len(values)]
+                trimmed_data[key] = values[lo:hi]
 
         trimmed[data_key] = trimmed_data
         return trimmed
@@ -573,7 +847,7 @@ class OpenMeteoClient:
         step: TimeStep = TimeStep.HOURLY,
         *,
         timezone: str = "auto",
-        variables: Optional[list[str]] = None,
+        variables: Optional[Sequence[str]] = None,
         trim_to_range: bool = True,
     ) -> Union[HourlyResponse, DailyResponse]:
         """Get historical weather data for a location and date range.
@@ -630,66 +904,93 @@ class OpenMeteoClient:
         self._validate_date_range(start_date, end_date)
 
         if variables is None:
-            variables = HOURLY_VARIABLES if step == TimeStep.HOURLY else DAILY_VARIABLES
+            variables_csv = _VARIABLES_CSV[step]
+        else:
+            variables_csv = ",".join(variables)
 
-        missing_months = self._historical_cache.get_missing_months(
+        missing_months = await self._historical_cache.aget_missing_months(
             latitude, longitude, step, start_date, end_date
         )
 
-        merged_data: Optional[dict[str, Any]] = None
-
         today_utc = datetime.now(tz=dt_timezone.utc).date()
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
 
-        for month_key in missing_months:
-            month_date = datetime.strptime(month_key, "%Y-%m")
-            month_start = month_date.date()
-            if month_start.month == 12:
-                month_end = month_start.replace(
-                    year=month_start.year + 1, day=1
-                ) - timedelta(days=1)
-            else:
-                month_end = month_start.replace(
-                    month=month_start.month + 1, day=1
-                ) - timedelta(days=1)
-
-            if month_end > today_utc:
-                month_end = today_utc
-
-            logger.debug(f"Fetching historical data for {month_key}")
+        month_bounds = {
+            month_key: (month_start, month_end)
+            for month_key, month_start, month_end in _iter_months(
+                start_date, end_date
+            )
+        }
 
-            params = {
+        base_params = httpx.QueryParams(
+            {
                 "latitude": latitude,
                 "longitude": longitude,
-                "start_date": month_start.isoformat(),
-                "end_date": month_end.isoformat(),
                 "timezone": timezone,
-                step.value: ",".join(variables),
+                step.value: variables_csv,
             }
+        )
 
-            data = await self._fetch(ARCHIVE_BASE_URL, params)
+        async def fetch_month(month_key: str) -> dict[str, Any]:
+            month_start, month_end = month_bounds[month_key]
+            if month_end > today_utc:
+                month_end = today_utc
 
-            self._historical_cache.save_month(
-                latitude, longitude, step, month_key, data
+            params = base_params.merge(
+                {
+                    "start_date": month_start.isoformat(),
+                    "end_date": month_end.isoformat(),
+                }
             )
 
-            merged_data = self._merge_data(merged_data, data, step)
+            async with semaphore:
+                logger.debug(f"Fetching historical data for {month_key}")
+                return await self._fetch(ARCHIVE_BASE_URL, params)
 
-        cached_months = self._historical_cache.get_cached_months(
-            latitude, longitude, step
+        # Months that did arrive are cached even if another month failed,
+        # so a retry only has to fetch what is still missing.
+        fetched_list = await asyncio.gather(
+            *(fetch_month(month_key) for month_key in missing_months),
+            return_exceptions=True,
         )
+        fetched = {
+            month_key: data
+            for month_key, data in zip(missing_months, fetched_list)
+            if not isinstance(data, BaseException)
+        }
+        if fetched:
+            await self._historical_cache.asave_months(
+                latitude, longitude, step, fetched
+            )
+        for result in fetched_list:
+            if isinstance(result, BaseException):
+                raise result
 
-        current = start_date.replace(day=1)
-        end_month = end_date.replace(day=1)
+        cached_months = await self._historical_cache.aget_cached_months(
+            latitude, longitude, step
+        )
 
-        while current <= end_month:
-            month_key = f"{current.year}-{current.month:02d}"
-            if month_key not in missing_months and month_key in cached_months:
-                cached = self._historical_cache.load_month(
+        months_in_range = list(month_bounds)
+        months_to_load = [
+            month_key
+            for month_key in months_in_range
+            if month_key not in fetched and month_key in cached_months
+        ]
+        cached_list = await asyncio.gather(
+            *(
+                self._historical_cache.aload_month(
                     latitude, longitude, step, month_key
                 )
-                if cached:
-                    merged_data = self._merge_data(merged_data, cached, step)
-            current = (current + timedelta(days=32)).replace(day=1)
+                for month_key in months_to_load
+            )
+        )
+        loaded = dict(zip(months_to_load, cached_list))
+
+        merged_data: Optional[dict[str, Any]] = None
+        for month_key in months_in_range:
+            month_data = fetched.get(month_key) or loaded.get(month_key)
+            if month_data:
+                merged_data = self._merge_data(merged_data, month_data, step)
 
         if merged_data is None:
             if step == TimeStep.HOURLY:
@@ -721,9 +1022,9 @@ class OpenMeteoClient:
             merged_data = self._trim_to_range(merged_data, start_date, end_date, step)
 
         if step == TimeStep.HOURLY:
-            return HourlyResponse(**merged_data)
+            return _build_model(HourlyResponse, merged_data)
         else:
-            return DailyResponse(**merged_data)
+            return _build_model(DailyResponse, merged_data)
 
     async def get_forecast(
         self,
@@ -733,7 +1034,7 @@ class OpenMeteoClient:
         step: TimeStep = TimeStep.HOURLY,
         *,
         timezone: str = "auto",
-        variables: Optional[list[str]] = None,
+        variables: Optional[Sequence[str]] = None,
         force_refresh: bool = False,
     ) -> Union[HourlyResponse, DailyResponse]:
         """Get weather forecast for a location.
@@ -745,6 +1046,9 @@ class OpenMeteoClient:
         1. TTL: Cache expires after ttl_minutes
         2. Freshness: Cache expires when approaching forecast end
 
+        The cache is keyed on coordinates rounded to two decimals, so
+        nearly identical locations share one cached forecast.
+
         Args:
             latitude: Latitude in decimal degrees (-90 to 90).
             longitude: Longitude in decimal degrees (-180 to 180).
@@ -757,6 +1061,9 @@ class OpenMeteoClient:
 
         Returns:
             HourlyResponse for HOURLY step, DailyResponse for DAILY step.
+            Cache hits return the cached response object itself, and its
+            variable lists are shared with other callers, so neither the
+            response nor its lists may be changed in place.
 
         Raises:
             OpenMeteoValidationError: If coordinates or days are invalid.
@@ -790,19 +1097,16 @@ class OpenMeteoClient:
         self._validate_coordinates(latitude, longitude)
         self._validate_forecast_days(days)
 
-        if variables is None:
-            variables = HOURLY_VARIABLES if step == TimeStep.HOURLY else DAILY_VARIABLES
+        cache_lat = round(latitude, _CACHE_COORD_PRECISION)
+        cache_lon = round(longitude, _CACHE_COORD_PRECISION)
 
         if not force_refresh and self._forecast_cache.is_valid(
-            latitude, longitude, step
+            cache_lat, cache_lon, step
         ):
-            cached = self._forecast_cache.get(latitude, longitude, step)
-            if cached:
+            cached = self._forecast_cache.get_model(cache_lat, cache_lon, step)
+            if cached is not None:
                 logger.debug(f"Using cached forecast for ({latitude}, {longitude})")
-                if step == TimeStep.HOURLY:
-                    return HourlyResponse(**cached)
-                else:
-                    return DailyResponse(**cached)
+                return cached
 
         logger.debug(f"Fetching fresh forecast for ({latitude}, {longitude})")
 
@@ -811,17 +1115,19 @@ class OpenMeteoClient:
             "longitude": longitude,
             "forecast_days": days,
             "timezone": timezone,
-            step.value: ",".join(variables),
+            step.value: (
+                _VARIABLES_CSV[step] if variables is None else ",".join(variables)
+            ),
         }
 
         data = await self._fetch(FORECAST_BASE_URL, params)
 
         if step == TimeStep.HOURLY:
-            response = HourlyResponse(**data)
+            response = _build_model(HourlyResponse, data)
         else:
-            response = DailyResponse(**data)
+            response = _build_model(DailyResponse, data)
 
-        self._forecast_cache.set(latitude, longitude, step, response)
+        self._forecast_cache.set(cache_lat, cache_lon, step, response, days=days)
 
         return response
 
@@ -866,11 +1172,11 @@ class OpenMeteoClient:
             "latitude": latitude,
             "longitude": longitude,
             "timezone": timezone,
-            "current": ",".join(CURRENT_VARIABLES),
+            "current": _CURRENT_VARIABLES_CSV,
         }
 
         data = await self._fetch(FORECAST_BASE_URL, params)
-        return CurrentResponse(**data)
+        return _build_model(CurrentResponse, data)
 
     def clear_forecast_cache(self) -> None:
         """Clear the in-memory forecast cache.
@@ -891,28 +1197,65 @@ class OpenMeteoClient:
         Deletes all cached historical data files. The next historical
         data request will fetch all data from the API.
 
+        The files are deleted before this returns, which can take a while
+        for a large cache. Inside a running event loop prefer
+        aclear_historical_cache(), which deletes them in the background.
+
         Warning:
             This permanently deletes cached data. Use with caution
             if you have accumulated a large cache.
 
         Example:
-            >>> async with OpenMeteoClient() as client:
-            ...     client.clear_historical_cache()  # Delete all cached data
+            >>> client = OpenMeteoClient()
+            >>> client.clear_historical_cache()  # Delete all cached data
         """
-        if self._historical_cache.cache_dir.exists():
-            import shutil
+        self._historical_cache.clear()
+
+    async def aclear_historical_cache(self) -> None:
+        """Clear the file-based historical cache without blocking.
+
+        Same effect as clear_historical_cache(), but the cache directory
+        is atomically renamed aside and recreated empty, so this returns
+        immediately regardless of cache size. The old files are deleted
+        by a background task, which close() waits for.
+
+        Warning:
+            This permanently deletes cached data. Use with caution
+            if you have accumulated a large cache.
 
-            shutil.rmtree(self._historical_cache.cache_dir)
-            self._historical_cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        Example:
+            >>> async with OpenMeteoClient() as client:
+            ...     await client.aclear_historical_cache()  # Delete all cached data
+        """
+        trash = self._historical_cache.detach()
+        if trash is None:
+            return
+        task = asyncio.create_task(asyncio.to_thread(_rmtree, trash))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
 
     def clear_all_cache(self) -> None:
         """Clear both forecast and historical caches.
 
-        Removes all cached data, both in-memory and file-based.
+        Removes all cached data, both in-memory and file-based. Historical
+        files are deleted before this returns; see aclear_all_cache().
 
         Example:
-            >>> async with OpenMeteoClient() as client:
-            ...     client.clear_all_cache()  # Clear everything
+            >>> client = OpenMeteoClient()
+            >>> client.clear_all_cache()  # Clear everything
         """
         self.clear_forecast_cache()
         self.clear_historical_cache()
+
+    async def aclear_all_cache(self) -> None:
+        """Clear both forecast and historical caches without blocking.
+
+        Like clear_all_cache(), but historical files are deleted in the
+        background as in aclear_historical_cache().
+
+        Example:
+            >>> async with OpenMeteoClient() as client:
+            ...     await client.aclear_all_cache()  # Clear everything
+        """
+        self.clear_forecast_cache()
+        await self.aclear_historical_cache()
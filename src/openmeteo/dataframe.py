@@ -11,6 +11,9 @@ Requirements:
 
 Functions:
     to_dataframe: Convert any response to a pandas DataFrame
+    to_dataframe_many: Convert many hourly or daily responses to one DataFrame
+    to_arrow: Convert any response to a pyarrow Table (needs pyarrow)
+    to_parquet: Write any response to a Parquet file (needs pyarrow)
 
 Example:
     Basic usage::
@@ -56,21 +59,188 @@ Example:
             print(df)
 """
 
+import functools
+import os
+import warnings
 from datetime import date, datetime
-from typing import Union
+from typing import Any, Iterable, Optional, Union, get_args
+
+from pydantic import BaseModel
 
 from .models import CurrentResponse, DailyResponse, HourlyResponse
 
+try:
+    import numpy as np
+    import pandas as pd
+
+    _PANDAS_OK = True
+except ImportError:  # pragma: no cover - only without the dataframe extra
+    np = None
+    pd = None
+    _PANDAS_OK = False
+
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _PYARROW_OK = True
+except ImportError:  # pragma: no cover - only without the arrow extra
+    pa = None
+    pq = None
+    _PYARROW_OK = False
+
 
 def _check_pandas() -> None:
     """Check if pandas is installed and raise informative error if not."""
-    try:
-        import pandas  # noqa: F401
-    except ImportError as e:
+    if not _PANDAS_OK:
         raise ImportError(
             "pandas is required for DataFrame conversion. "
             "Install it with: pip install pandas"
-        ) from e
+        )
+
+
+def _check_pyarrow() -> None:
+    """Check if pyarrow is installed and raise informative error if not."""
+    if not _PYARROW_OK:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet output. "
+            "Install it with: pip install pyarrow"
+        )
+
+
+# Response type -> (data container attribute, whether its fields are lists).
+_CONTAINERS: dict[type[BaseModel], tuple[str, bool]] = {
+    HourlyResponse: ("hourly", True),
+    DailyResponse: ("daily", True),
+    CurrentResponse: ("current", False),
+}
+
+
+def _container_data(response: Any) -> tuple[type[BaseModel], dict[str, Any]]:
+    """Extract the data container of a response as lists of field values.
+
+    Looks the response type up in _CONTAINERS (one dict lookup for the
+    exact classes, an isinstance scan only for subclasses). Only fields in
+    the model's model_fields_set are read: every optional field defaults
+    to None, so a variable that was not requested is simply absent from
+    the result. Scalar CurrentData fields are wrapped in one-element lists.
+
+    Args:
+        response: HourlyResponse, DailyResponse or CurrentResponse.
+
+    Returns:
+        Tuple of (data model class, values of the set fields keyed by
+        field name).
+
+    Raises:
+        ValueError: If response type is not recognized.
+    """
+    entry = _CONTAINERS.get(type(response))
+    if entry is None:
+        entry = next(
+            (v for cls, v in _CONTAINERS.items() if isinstance(response, cls)), None
+        )
+        if entry is None:
+            raise ValueError(
+                f"Unsupported response type: {type(response).__name__}. "
+                "Expected HourlyResponse, DailyResponse, or CurrentResponse."
+            )
+    attr, columnar = entry
+    container = getattr(response, attr)
+    model_cls = type(container)
+    fields = vars(container)
+    if columnar:
+        data = {name: fields[name] for name in container.model_fields_set}
+    else:
+        data = {name: [fields[name]] for name in container.model_fields_set}
+    return model_cls, data
+
+
+def _scalar_type(annotation: Any) -> Any:
+    """Strip Optional[...] and list[...] wrappers from a field annotation."""
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    return _scalar_type(args[0]) if args else annotation
+
+
+@functools.lru_cache(maxsize=None)
+def _column_types(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Map each field of a data model to its scalar type (float, int, str)."""
+    return {
+        name: _scalar_type(field.annotation)
+        for name, field in model_cls.model_fields.items()
+    }
+
+
+def _parse_iso(
+    times: Union[list[Optional[str]], "np.ndarray"],
+) -> Union["np.ndarray", "pd.arrays.DatetimeArray"]:
+    """Parse OpenMeteo ISO8601 timestamps with NumPy's vectorized parser.
+
+    OpenMeteo returns times as "YYYY-MM-DDTHH:MM" (or "YYYY-MM-DD" for
+    daily data), which NumPy parses in a single C loop. Parsing is done at
+    second resolution, so "...:30" seconds are kept. Missing values
+    become NaT.
+
+    Strings NumPy cannot represent exactly (e.g. with a UTC offset, which
+    it would silently convert to naive UTC) fall back to pd.to_datetime,
+    which keeps the offset as a timezone-aware column.
+
+    Arrays that already hold datetime64 values are only cast to
+    nanosecond resolution (without a copy when already datetime64[ns]).
+
+    Args:
+        times: ISO8601 timestamp strings, or a datetime64 array.
+
+    Returns:
+        numpy array of dtype datetime64[ns], or a pandas datetime array
+        for strings that needed the pd.to_datetime fallback.
+    """
+    if isinstance(times, np.ndarray) and times.dtype.kind == "M":
+        return times.astype("datetime64[ns]", copy=False)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            parsed = np.array(times, dtype="datetime64[s]")
+    except (UserWarning, ValueError):
+        return pd.to_datetime(list(times)).array
+    return parsed.astype("datetime64[ns]")
+
+
+def _build_columns(model_cls: type[BaseModel], data: dict[str, Any]) -> dict[str, Any]:
+    """Convert model data to typed column arrays.
+
+    Builds each column with an explicit dtype so pandas does not have to
+    inspect every element to infer one: float64 for float variables,
+    nullable Int64 for integer variables and datetime64[ns] for
+    timestamps. Variables absent from the response become all-missing
+    columns of the matching type.
+
+    Args:
+        model_cls: HourlyData, DailyData or CurrentData.
+        data: Field values of the model as lists, keyed by field name.
+            CurrentData scalars are passed as one-element lists.
+
+    Returns:
+        Dict of column name to numpy or pandas array.
+    """
+    n = len(data["time"])
+    columns: dict[str, Any] = {}
+    for name, scalar in _column_types(model_cls).items():
+        values = data.get(name)
+        if scalar is str:
+            columns[name] = _parse_iso(values if values is not None else [None] * n)
+        elif values is None:
+            columns[name] = (
+                pd.array([None] * n, dtype="Int64")
+                if scalar is int
+                else np.full(n, np.nan)
+            )
+        elif scalar is int:
+            columns[name] = pd.array(values, dtype="Int64")
+        else:
+            columns[name] = np.asarray(values, dtype=np.float64)
+    return columns
 
 
 def to_dataframe(
@@ -91,7 +261,9 @@ def to_dataframe(
 
     Returns:
         pandas DataFrame with all weather variables as columns.
-        The 'time' column is converted to datetime64[ns] dtype.
+        The 'time' column (and daily 'sunrise'/'sunset') is converted to
+        datetime64[ns] dtype. Weather variables are float64, or nullable
+        Int64 for integer variables such as weather_code.
 
     Raises:
         ImportError: If pandas is not installed.
@@ -117,34 +289,169 @@ def to_dataframe(
         row with current conditions.
     """
     _check_pandas()
-    import pandas as pd
 
-    if isinstance(response, HourlyResponse):
-        data = response.hourly.model_dump()
-        df = pd.DataFrame(data)
-        df["time"] = pd.to_datetime(df["time"])
-        return df
-
-    if isinstance(response, DailyResponse):
-        data = response.daily.model_dump()
-        df = pd.DataFrame(data)
-        df["time"] = pd.to_datetime(df["time"])
-        if "sunrise" in df.columns:
-            df["sunrise"] = pd.to_datetime(df["sunrise"])
-        if "sunset" in df.columns:
-            df["sunset"] = pd.to_datetime(df["sunset"])
-        return df
-
-    if isinstance(response, CurrentResponse):
-        data = response.current.model_dump()
-        df = pd.DataFrame([data])
-        df["time"] = pd.to_datetime(df["time"])
-        return df
-
-    raise ValueError(
-        f"Unsupported response type: {type(response).__name__}. "
-        "Expected HourlyResponse, DailyResponse, or CurrentResponse."
-    )
-
-
-__all__ = ["to_dataframe"]
+    model_cls, data = _container_data(response)
+    return pd.DataFrame(_build_columns(model_cls, data), copy=False)
+
+
+def to_dataframe_many(
+    responses: Iterable[Union[HourlyResponse, DailyResponse]],
+    add_location: bool = True,
+) -> "pd.DataFrame":
+    """Convert several hourly or daily responses into a single DataFrame.
+
+    Equivalent to concatenating to_dataframe() of each response, but each
+    column is allocated once for all rows and filled slice by slice, and
+    all timestamps are parsed in a single pass. Useful when collecting
+    data for many locations.
+
+    Args:
+        responses: HourlyResponse or DailyResponse objects. All responses
+            must have the same step.
+        add_location: If True, add a 'location_id' column holding the
+            position of each row's response in `responses`.
+
+    Returns:
+        pandas DataFrame with the rows of all responses in order, with the
+        same columns and dtypes as to_dataframe().
+
+    Raises:
+        ImportError: If pandas is not installed.
+        ValueError: If a response type is not recognized or hourly and
+            daily responses are mixed.
+
+    Example:
+        >>> from openmeteo.dataframe import to_dataframe_many
+        >>>
+        >>> async with OpenMeteoClient() as client:
+        ...     responses = await asyncio.gather(
+        ...         client.get_forecast(55.75, 37.62),
+        ...         client.get_forecast(59.94, 30.31),
+        ...     )
+        ...     df = to_dataframe_many(responses)
+        ...     print(df.groupby("location_id")["temperature_2m"].mean())
+    """
+    _check_pandas()
+
+    containers = []
+    for response in responses:
+        if isinstance(response, HourlyResponse):
+            containers.append(response.hourly)
+        elif isinstance(response, DailyResponse):
+            containers.append(response.daily)
+        else:
+            raise ValueError(
+                f"Unsupported response type: {type(response).__name__}. "
+                "Expected HourlyResponse or DailyResponse."
+            )
+    if not containers:
+        return pd.DataFrame()
+
+    model_cls = type(containers[0])
+    if any(type(container) is not model_cls for container in containers):
+        raise ValueError("Cannot combine hourly and daily responses.")
+
+    counts = [len(container.time) for container in containers]
+    total = sum(counts)
+    columns: dict[str, Any] = {}
+    if add_location:
+        columns["location_id"] = np.repeat(np.arange(len(containers)), counts)
+
+    for name, scalar in _column_types(model_cls).items():
+        if scalar is float:
+            out = np.full(total, np.nan)
+            offset = 0
+            for container, n in zip(containers, counts):
+                values = getattr(container, name)
+                if values is not None:
+                    out[offset : offset + n] = np.asarray(values, dtype=np.float64)
+                offset += n
+            columns[name] = out
+            continue
+
+        merged: list[Any] = []
+        for container, n in zip(containers, counts):
+            values = getattr(container, name)
+            merged.extend(values if values is not None else [None] * n)
+        if scalar is str:
+            columns[name] = _parse_iso(merged)
+        else:
+            columns[name] = pd.array(merged, dtype="Int64")
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def to_arrow(
+    response: Union[HourlyResponse, DailyResponse, CurrentResponse],
+) -> "pa.Table":
+    """Convert an OpenMeteo response to a pyarrow Table.
+
+    Builds typed Arrow arrays straight from the response model, without
+    going through pandas. Columns and types mirror to_dataframe(): float64
+    for float variables, int64 for integer variables and timestamp[ns] for
+    'time' (and daily 'sunrise'/'sunset'), with missing values as nulls.
+
+    Args:
+        response: HourlyResponse, DailyResponse or CurrentResponse.
+
+    Returns:
+        pyarrow Table with one column per weather variable.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If response type is not recognized.
+
+    Example:
+        >>> from openmeteo.dataframe import to_arrow
+        >>>
+        >>> table = to_arrow(response)
+        >>> table.schema.field("temperature_2m").type
+        DataType(double)
+    """
+    _check_pyarrow()
+
+    model_cls, data = _container_data(response)
+    n = len(data["time"])
+    arrays = {}
+    for name, scalar in _column_types(model_cls).items():
+        values = data.get(name)
+        if values is None:
+            values = [None] * n
+        if scalar is str:
+            arrays[name] = pa.array(values, type=pa.string()).cast(pa.timestamp("ns"))
+        elif scalar is int:
+            arrays[name] = pa.array(values, type=pa.int64())
+        else:
+            arrays[name] = pa.array(values, type=pa.float64())
+    return pa.table(arrays)
+
+
+def to_parquet(
+    response: Union[HourlyResponse, DailyResponse, CurrentResponse],
+    path: Union[str, "os.PathLike[str]"],
+    compression: str = "zstd",
+) -> None:
+    """Write an OpenMeteo response to a Parquet file.
+
+    Uses to_arrow() and writes the table directly, so no pandas DataFrame
+    is built along the way.
+
+    Args:
+        response: HourlyResponse, DailyResponse or CurrentResponse.
+        path: Destination file path.
+        compression: Parquet compression codec. Default: "zstd".
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If response type is not recognized.
+
+    Example:
+        >>> from openmeteo.dataframe import to_parquet
+        >>>
+        >>> to_parquet(response, "moscow_2024_01.parquet")
+    """
+    table = to_arrow(response)
+    pq.write_table(table, path, compression=compression)
+
+
+__all__ = ["to_dataframe", "to_dataframe_many", "to_arrow", "to_parquet"]
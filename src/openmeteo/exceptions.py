@@ -64,7 +64,10 @@ class OpenMeteoAPIError(OpenMeteoError):
 
     def __init__(self, reason: str) -> None:
         self.reason = reason
-        super().__init__(f"API error: {reason}")
+        super().__init__(reason)
+
+    def __str__(self) -> str:
+        return f"API error: {self.reason}"
 
 
 class OpenMeteoConnectionError(OpenMeteoError):
@@ -15,6 +15,12 @@ Note:
     data, making it ideal for ML pipelines where training data (historical)
     and inference data (forecast) need consistent schemas.
 
+    Response and data container models are frozen, so fields cannot be
+    reassigned. Freezing does not make the variable lists immutable:
+    forecast cache hits return the same response object, lists included,
+    to every caller, so list contents must not be changed in place. Use
+    model_copy(update=...) to derive a modified copy.
+
 Example:
     Accessing hourly data::
 
@@ -33,11 +39,15 @@ Example:
             print(f"{day}: {low}°C - {high}°C")
 """
 
+import functools
+import os
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 
 class MetaInfo(BaseModel):
     """Base metadata shared across response types.
@@ -142,6 +152,8 @@ class HourlyData(BaseModel):
         ...     print(f"{t}: {temp}°C, {humidity}%")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     time: list[str]
     temperature_2m: Optional[list[Optional[float]]] = None
     relative_humidity_2m: Optional[list[Optional[int]]] = None
@@ -209,6 +221,8 @@ class DailyData(BaseModel):
         ...     print(f"{day}: {low}°C - {high}°C, rain: {rain}mm")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     time: list[str]
     temperature_2m_max: Optional[list[Optional[float]]] = None
     temperature_2m_min: Optional[list[Optional[float]]] = None
@@ -263,6 +277,8 @@ class CurrentData(BaseModel):
         >>> print(f"Wind: {current.wind_speed_10m} km/h")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     time: str
     interval: int
     temperature_2m: Optional[float] = None
@@ -307,7 +323,7 @@ class HourlyResponse(BaseModel):
         ...     print(f"{t}: {response.hourly.temperature_2m[i]}°C")
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     latitude: float
     longitude: float
@@ -347,7 +363,7 @@ class DailyResponse(BaseModel):
         ...     print(f"{day}: {low}°C - {high}°C")
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     latitude: float
     longitude: float
@@ -384,7 +400,7 @@ class CurrentResponse(BaseModel):
         >>> print(f"Wind: {c.wind_speed_10m} km/h")
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     latitude: float
     longitude: float
@@ -413,3 +429,45 @@ class ErrorResponse(BaseModel):
 
     error: bool
     reason: str
+
+
+@functools.lru_cache(maxsize=None)
+def _nested_models(model_cls: type[BaseModel]) -> dict[str, type[BaseModel]]:
+    """Map field names of model_cls to their nested model classes."""
+    nested = {}
+    for name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested[name] = annotation
+    return nested
+
+
+def _build_model(model_cls: type[_ModelT], data: dict[str, Any]) -> _ModelT:
+    """Build a response model from trusted OpenMeteo data.
+
+    OpenMeteo responses have a stable schema, so by default the model and
+    its nested models are assembled with model_construct(), skipping
+    per-value validation of potentially tens of thousands of floats.
+    Set the environment variable OPENMETEO_STRICT=1 to validate fully.
+
+    Args:
+        model_cls: Response model class to build.
+        data: Parsed API data.
+
+    Returns:
+        Instance of model_cls.
+
+    Example:
+        >>> response = _build_model(HourlyResponse, api_data)
+    """
+    if os.environ.get("OPENMETEO_STRICT") == "1":
+        return model_cls.model_validate(data)
+
+    nested = _nested_models(model_cls)
+    if nested:
+        data = dict(data)
+        for name, nested_cls in nested.items():
+            value = data.get(name)
+            if isinstance(value, dict):
+                data[name] = _build_model(nested_cls, value)
+    return model_cls.model_construct(**data)
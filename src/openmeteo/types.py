@@ -110,3 +110,12 @@ For example, with a value of 5, data from the current month and
 the previous 5 months will always be re-fetched to get the latest
 corrections.
 """
+
+MAX_CONCURRENT_REQUESTS = 8
+"""int: Maximum number of archive requests issued concurrently.
+
+get_historical() fetches missing months in parallel to overlap network
+round trips. This bounds how many requests are in flight at once to
+stay polite to the free OpenMeteo API. Can be overridden with the
+max_concurrent_requests argument of OpenMeteoClient.
+"""
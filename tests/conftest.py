@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Empty directory for a test's cache files, unique per test."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="module")
+def http_response_factory():
+    """Build successful httpx responses with a given raw body.
+
+    Real httpx.Response objects are cheaper to create than MagicMock
+    trees and behave exactly like what the client receives.
+    """
+    request = httpx.Request("GET", "https://example.com")
+
+    def make(content: bytes) -> httpx.Response:
+        return httpx.Response(200, content=content, request=request)
+
+    return make
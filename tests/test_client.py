@@ -1,8 +1,9 @@
+import asyncio
+import httpx
 import pytest
+from pydantic import ValidationError
 from datetime import date, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
-from pathlib import Path
-import tempfile
 import os
 
 from openmeteo import (
@@ -20,13 +21,17 @@ from openmeteo.models import (
     DailyData,
     HourlyUnits,
     DailyUnits,
+    _build_model,
 )
+from openmeteo.client import HOURLY_VARIABLES, _iter_months
 from openmeteo.cache import (
     HistoricalCache,
     ForecastCache,
     _coord_key,
+    _format_coord_key,
     _month_key,
     _parse_date,
+    _rmtree,
 )
 
 
@@ -174,6 +179,9 @@ class TestMergeData:
         merged = client._merge_data(None, new, TimeStep.DAILY)
 
         assert merged == new
+        assert merged["daily"]["temperature_2m_max"] is not (
+            new["daily"]["temperature_2m_max"]
+        )
 
     def test_merge_non_overlapping_data(self):
         client = OpenMeteoClient()
@@ -186,6 +194,42 @@ class TestMergeData:
         assert merged["daily"]["time"] == ["2024-01-01", "2024-01-02"]
         assert merged["daily"]["temperature_2m_max"] == [5.0, 6.0]
 
+    def test_merge_new_data_before_existing(self):
+        client = OpenMeteoClient()
+        existing = {"daily": {"time": ["2024-01-03"], "temperature_2m_max": [7.0]}}
+        new = {
+            "daily": {
+                "time": ["2024-01-01", "2024-01-02"],
+                "temperature_2m_max": [5.0, 6.0],
+            }
+        }
+
+        merged = client._merge_data(existing, new, TimeStep.DAILY)
+
+        assert merged["daily"]["time"] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert merged["daily"]["temperature_2m_max"] == [5.0, 6.0, 7.0]
+
+    def test_merge_skips_duplicate_times(self):
+        client = OpenMeteoClient()
+        existing = {
+            "daily": {
+                "time": ["2024-01-01", "2024-01-02"],
+                "temperature_2m_max": [5.0, 6.0],
+            }
+        }
+        new = {
+            "daily": {
+                "time": ["2024-01-02", "2024-01-03"],
+                "temperature_2m_max": [60.0, 7.0],
+            }
+        }
+
+        merged = client._merge_data(existing, new, TimeStep.DAILY)
+
+        assert merged["daily"]["time"] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert merged["daily"]["temperature_2m_max"] == [5.0, 6.0, 7.0]
+        assert existing["daily"]["time"] == ["2024-01-01", "2024-01-02"]
+
     def test_merge_adds_new_variable(self):
         client = OpenMeteoClient()
         existing = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
@@ -200,7 +244,49 @@ class TestMergeData:
         merged = client._merge_data(existing, new, TimeStep.HOURLY)
 
         assert len(merged["hourly"]["time"]) == 2
-        assert merged["hourly"]["humidity"] == [80.0]
+        assert merged["hourly"]["humidity"] == [None, 80.0]
+
+    def test_merge_interleaved_times_stays_sorted(self):
+        client = OpenMeteoClient()
+        existing = {
+            "daily": {
+                "time": ["2024-01-01", "2024-01-03"],
+                "temperature_2m_max": [1.0, 3.0],
+            }
+        }
+        new = {
+            "daily": {
+                "time": ["2024-01-02", "2024-01-03", "2024-01-04"],
+                "temperature_2m_max": [2.0, 30.0, 4.0],
+                "rain_sum": [0.2, 0.3, 0.4],
+            }
+        }
+
+        merged = client._merge_data(existing, new, TimeStep.DAILY)
+
+        assert merged["daily"]["time"] == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]
+        assert merged["daily"]["temperature_2m_max"] == [1.0, 2.0, 3.0, 4.0]
+        assert merged["daily"]["rain_sum"] == [None, 0.2, None, 0.4]
+
+
+class TestIterMonths:
+    def test_iter_months_across_year_boundary(self):
+        months = list(_iter_months(date(2023, 12, 15), date(2024, 2, 3)))
+
+        assert months == [
+            ("2023-12", date(2023, 12, 1), date(2023, 12, 31)),
+            ("2024-01", date(2024, 1, 1), date(2024, 1, 31)),
+            ("2024-02", date(2024, 2, 1), date(2024, 2, 29)),
+        ]
+
+    def test_iter_months_single_month(self):
+        months = list(_iter_months(date(2023, 2, 10), date(2023, 2, 11)))
+        assert months == [("2023-02", date(2023, 2, 1), date(2023, 2, 28))]
 
 
 class TestCacheKey:
@@ -213,6 +299,15 @@ class TestCacheKey:
         key = _coord_key(-33.865, 151.21)
         assert "m33" in key
 
+    @pytest.mark.parametrize("first", [0.0, -0.0])
+    def test_coord_key_signed_zero_independent_of_call_order(self, first):
+        _format_coord_key.cache_clear()
+        _coord_key(first, 1.0)
+
+        assert _coord_key(0.0, 1.0) == "0p0000_1p0000"
+        assert _coord_key(-0.0, 1.0) == "m0p0000_1p0000"
+        assert _coord_key(1.0, -0.0) == "1p0000_m0p0000"
+
     def test_month_key_format(self):
         key = _month_key(date(2024, 1, 15))
         assert key == "2024-01"
@@ -227,77 +322,415 @@ class TestCacheKey:
 
 
 class TestHistoricalCache:
-    def test_init_creates_directory(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = Path(tmpdir) / "cache"
-            cache = HistoricalCache(cache_dir)
-            assert cache_dir.exists()
-
-    def test_save_and_load_month(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
-            data = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
-
-            cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+    def test_init_creates_directory(self, cache_dir):
+        cache_dir = cache_dir / "cache"
+        cache = HistoricalCache(cache_dir)
+        assert cache_dir.exists()
+
+    def test_save_and_load_month(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        data = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
+
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+        loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        assert loaded == data
+
+    def test_load_month_handles_short_reads(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        data = {"hourly": {"time": ["2024-01-01T00:00"] * 100}}
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+        real_read = os.read
+
+        with patch(
+            "os.read", side_effect=lambda fd, n: real_read(fd, min(n, 64))
+        ):
+            loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        assert loaded == data
+
+    def test_load_month_reuses_parsed_data(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        data = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+
+        first = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+        second = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        assert first is second
+
+    def test_final_month_memory_hit_skips_stat(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        with patch("openmeteo.cache.os.stat") as mock_stat:
+            loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        assert loaded == {"test": 1}
+        mock_stat.assert_not_called()
+
+    def test_recent_month_memory_hit_checks_file(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        month_key = date.today().strftime("%Y-%m")
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, month_key, {"test": 1})
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, month_key)
+
+        os.unlink(cache._get_cache_file(55.75, 37.62, TimeStep.HOURLY, month_key))
+
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, month_key) is None
+
+    def test_month_cached_while_recent_is_checked_once_final(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        with patch.object(cache, "is_month_recent", return_value=True):
+            cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        os.unlink(cache._get_cache_file(55.75, 37.62, TimeStep.HOURLY, "2024-01"))
+
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") is None
+
+    def test_month_cached_while_recent_skips_stat_once_confirmed(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        with patch.object(cache, "is_month_recent", return_value=True):
+            cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        with patch("openmeteo.cache.os.stat") as mock_stat:
             loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
 
-            assert loaded == data
+        assert loaded == {"test": 1}
+        mock_stat.assert_not_called()
+
+    def test_save_month_invalidates_memory_cache(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 2})
+        loaded = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        assert loaded == {"test": 2}
+
+    def test_memory_cache_keeps_signed_zero_files_apart(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(0.0, 37.62, TimeStep.HOURLY, "2024-01", {"v": "pos"})
+        cache.load_month(0.0, 37.62, TimeStep.HOURLY, "2024-01")
+
+        cache.save_month(-0.0, 37.62, TimeStep.HOURLY, "2024-01", {"v": "neg"})
+
+        assert cache.load_month(-0.0, 37.62, TimeStep.HOURLY, "2024-01") == {
+            "v": "neg"
+        }
+        assert cache.load_month(0.0, 37.62, TimeStep.HOURLY, "2024-01") == {
+            "v": "pos"
+        }
+
+    def test_memory_cache_shared_by_coordinates_of_one_file(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+
+        cache.save_month(55.750001, 37.62, TimeStep.HOURLY, "2024-01", {"test": 2})
+
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") == {
+            "test": 2
+        }
+
+    def test_memory_cache_evicts_oldest(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache._memory_max = 1
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-02", {"test": 2})
+
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+        cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-02")
+
+        assert len(cache._memory) == 1
+
+    def test_save_and_load_month_msgpack(self, cache_dir):
+        pytest.importorskip("msgpack")
+        cache = HistoricalCache(cache_dir, format="msgpack")
+        data = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
+
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+
+        assert (cache_dir / "55p7500_37p6200_hourly_2024-01.msgpack").exists()
+        assert HistoricalCache(cache_dir, format="msgpack").load_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01"
+        ) == data
+
+    def test_save_and_load_month_compressed(self, cache_dir):
+        pytest.importorskip("zstandard")
+        cache = HistoricalCache(cache_dir, compress=True)
+        data = {"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}
 
-    def test_load_nonexistent_month(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
-            result = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
-            assert result is None
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
 
-    def test_get_cached_months(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
-            cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        assert (cache_dir / "55p7500_37p6200_hourly_2024-01.json.zst").exists()
+        reopened = HistoricalCache(cache_dir, compress=True)
+        assert reopened.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == {
+            "2024-01"
+        }
+        assert reopened.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") == data
+
+    def test_unsupported_format(self, cache_dir):
+        with pytest.raises(ValueError) as exc_info:
+            HistoricalCache(cache_dir, format="parquet")
+        assert "Unsupported cache format" in str(exc_info.value)
+
+    def test_save_month_with_fsync(self, cache_dir):
+        cache = HistoricalCache(cache_dir, fsync=True)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") == {
+            "test": 1
+        }
+        assert [p.name for p in cache_dir.iterdir()] == [
+            "55p7500_37p6200_hourly_2024-01.json"
+        ]
+
+    def test_failed_save_keeps_previous_file(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"x": object()})
+
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") == {
+            "test": 1
+        }
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_concurrent_saves_of_one_month(self, cache_dir, caplog):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = HistoricalCache(cache_dir)
+        data = {"hourly": {"time": ["2024-01-01T00:00"] * 5000}}
+
+        def save(_):
+            for _ in range(10):
+                cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", data)
+
+        with caplog.at_level("ERROR", logger="openmeteo.cache"):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(save, range(4)))
+
+        assert not caplog.records
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01") == data
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_save_months_batch(self, cache_dir):
+        cache = HistoricalCache(cache_dir, fsync=True)
+
+        cache.save_months(
+            55.75,
+            37.62,
+            TimeStep.HOURLY,
+            {
+                "2024-01": {"test": 1},
+                "2024-02": {"x": object()},
+                "2024-03": {"test": 3},
+            },
+        )
+
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == {
+            "2024-01",
+            "2024-03",
+        }
+        assert cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-03") == {
+            "test": 3
+        }
+        assert len(list(cache_dir.iterdir())) == 2
+
+    @pytest.mark.asyncio
+    async def test_asave_months(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+
+        await cache.asave_months(
+            55.75, 37.62, TimeStep.DAILY, {"2024-01": {"test": 1}}
+        )
+
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.DAILY) == {"2024-01"}
+
+    def test_get_cached_months_rescans_after_ttl(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        other = HistoricalCache(cache_dir)
+        other.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == set()
+
+        cache._index_built -= 60
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == {
+            "2024-01"
+        }
+
+    def test_rescan_keeps_months_saved_during_scan(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        scan = cache._scan_index
+
+        def scan_with_concurrent_save():
+            index = scan()
             cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-02", {"test": 2})
+            return index
 
+        cache._index_built -= 60
+        with patch.object(cache, "_scan_index", side_effect=scan_with_concurrent_save):
             months = cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY)
 
-            assert "2024-01" in months
-            assert "2024-02" in months
+        assert months == {"2024-02"}
 
-    def test_is_month_recent(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
+    def test_rescan_discarded_after_detach(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        scan = cache._scan_index
 
-            today = date.today()
-            current_month = _month_key(today)
-            old_month = f"{today.year - 2}-01"
+        def scan_with_concurrent_clear():
+            index = scan()
+            cache.clear()
+            return index
 
-            assert cache.is_month_recent(current_month) is True
-            assert cache.is_month_recent(old_month) is False
+        cache._index_built -= 60
+        with patch.object(cache, "_scan_index", side_effect=scan_with_concurrent_clear):
+            months = cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY)
 
-    def test_get_missing_months(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
+        assert months == set()
 
-            start = date(2024, 1, 1)
-            end = date(2024, 3, 31)
-            missing = cache.get_missing_months(
-                55.75, 37.62, TimeStep.HOURLY, start, end
+    @pytest.mark.asyncio
+    async def test_async_index_lookups_rescan_in_worker_thread(self, cache_dir):
+        import threading
+
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2023-01", {"test": 1})
+        scan = cache._scan_index
+        scan_threads = []
+
+        def record_thread():
+            scan_threads.append(threading.get_ident())
+            return scan()
+
+        with patch.object(cache, "_scan_index", side_effect=record_thread):
+            cache._index_built -= 60
+            months = await cache.aget_cached_months(55.75, 37.62, TimeStep.HOURLY)
+            cache._index_built -= 60
+            missing = await cache.aget_missing_months(
+                55.75, 37.62, TimeStep.HOURLY, date(2023, 1, 1), date(2023, 2, 28)
             )
+            await cache.aget_cached_months(55.75, 37.62, TimeStep.HOURLY)
 
-            assert "2024-01" in missing
-            assert "2024-02" in missing
-            assert "2024-03" in missing
+        assert months == {"2023-01"}
+        assert missing == ["2023-02"]
+        assert len(scan_threads) == 2
+        assert threading.get_ident() not in scan_threads
 
-    def test_get_missing_months_with_cached(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = HistoricalCache(Path(tmpdir))
-            cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+    def test_load_nonexistent_month(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        result = cache.load_month(55.75, 37.62, TimeStep.HOURLY, "2024-01")
+        assert result is None
 
-            start = date(2024, 1, 1)
-            end = date(2024, 2, 29)
-            missing = cache.get_missing_months(
-                55.75, 37.62, TimeStep.HOURLY, start, end
-            )
+    def test_get_cached_months(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-02", {"test": 2})
+
+        months = cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY)
+
+        assert "2024-01" in months
+        assert "2024-02" in months
+
+    def test_get_cached_months_indexes_existing_files(self, cache_dir):
+        HistoricalCache(cache_dir).save_month(
+            55.75, 37.62, TimeStep.DAILY, "2024-03", {"test": 1}
+        )
+        (cache_dir / "notes.txt").write_text("ignored")
+        (cache_dir / "broken.json").write_text("{}")
+
+        cache = HistoricalCache(cache_dir)
+
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.DAILY) == {"2024-03"}
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == set()
+
+    def test_clear_resets_index(self, cache_dir):
+        cache = HistoricalCache(cache_dir / "cache")
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+
+        cache.clear()
+
+        assert cache.get_cached_months(55.75, 37.62, TimeStep.HOURLY) == set()
+        assert cache.cache_dir.exists()
+        assert os.listdir(cache_dir) == ["cache"]
+
+    def test_rmtree_without_rm_falls_back_to_shutil(self, cache_dir):
+        tree = cache_dir / "tree" / "nested"
+        tree.mkdir(parents=True)
+        (tree / "file.json").write_text("{}")
+
+        with patch("openmeteo.cache.shutil.which", return_value=None):
+            _rmtree(cache_dir / "tree")
+
+        assert os.listdir(cache_dir) == []
+
+    def test_detach_without_directory(self, cache_dir):
+        cache = HistoricalCache(cache_dir / "cache")
+        cache.cache_dir.rmdir()
+
+        assert cache.detach() is None
+        assert cache.cache_dir.is_dir()
+
+    def test_is_month_recent(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+
+        today = date.today()
+        current_month = _month_key(today)
+        old_month = f"{today.year - 2}-01"
+
+        assert cache.is_month_recent(current_month) is True
+        assert cache.is_month_recent(old_month) is False
+
+    def test_recent_cutoff_computed_once_per_day(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+
+        cutoff = cache._recent_cutoff()
+        cache._cutoff = (1970, 1)
+        assert cache._recent_cutoff() == (1970, 1)
+
+        cache._cutoff_day = date(1970, 1, 1)
+        assert cache._recent_cutoff() == cutoff
+
+    def test_get_missing_months(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+
+        start = date(2024, 1, 1)
+        end = date(2024, 3, 31)
+        missing = cache.get_missing_months(
+            55.75, 37.62, TimeStep.HOURLY, start, end
+        )
+
+        assert "2024-01" in missing
+        assert "2024-02" in missing
+        assert "2024-03" in missing
 
-            assert "2024-01" not in missing
-            assert "2024-02" in missing
+    def test_get_missing_months_across_year_boundary(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+
+        missing = cache.get_missing_months(
+            55.75, 37.62, TimeStep.DAILY, date(2023, 11, 20), date(2024, 2, 3)
+        )
+
+        assert missing == ["2023-11", "2023-12", "2024-01", "2024-02"]
+
+    def test_get_missing_months_with_cached(self, cache_dir):
+        cache = HistoricalCache(cache_dir)
+        cache.save_month(55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1})
+
+        start = date(2024, 1, 1)
+        end = date(2024, 2, 29)
+        missing = cache.get_missing_months(
+            55.75, 37.62, TimeStep.HOURLY, start, end
+        )
+
+        assert "2024-01" not in missing
+        assert "2024-02" in missing
 
 
 class TestForecastCache:
@@ -314,6 +747,36 @@ class TestForecastCache:
         assert result is not None
         assert "hourly" in result
 
+    def test_set_defers_model_dump(self):
+        cache = ForecastCache()
+
+        response = MagicMock()
+        response.hourly.time = ["2030-01-01T00:00"]
+        response.model_dump.return_value = {"hourly": {"time": ["2030-01-01T00:00"]}}
+
+        cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+        response.model_dump.assert_not_called()
+
+        assert cache.get_model(55.75, 37.62, TimeStep.HOURLY) is response
+        cache.get(55.75, 37.62, TimeStep.HOURLY)
+        cache.get(55.75, 37.62, TimeStep.HOURLY)
+        response.model_dump.assert_called_once()
+
+    def test_evicts_least_recently_used(self):
+        cache = ForecastCache(maxsize=2)
+
+        response = MagicMock()
+        response.hourly.time = ["2030-01-01T00:00"]
+
+        cache.set(1.0, 1.0, TimeStep.HOURLY, response)
+        cache.set(2.0, 2.0, TimeStep.HOURLY, response)
+        assert cache.is_valid(1.0, 1.0, TimeStep.HOURLY) is True
+        cache.set(3.0, 3.0, TimeStep.HOURLY, response)
+
+        assert cache.get_model(1.0, 1.0, TimeStep.HOURLY) is response
+        assert cache.get_model(2.0, 2.0, TimeStep.HOURLY) is None
+        assert cache.get_model(3.0, 3.0, TimeStep.HOURLY) is response
+
     def test_is_valid_nonexistent(self):
         cache = ForecastCache()
         assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is False
@@ -328,6 +791,63 @@ class TestForecastCache:
         cache.set(55.75, 37.62, TimeStep.HOURLY, response)
         assert cache.get(55.75, 37.62, TimeStep.HOURLY) is not None
 
+    def test_is_valid_with_fresh_entry(self):
+        cache = ForecastCache(ttl_minutes=60)
+
+        response = MagicMock()
+        response.hourly.time = ["2030-01-01T00:00"]
+        cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+
+        assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is True
+
+    def test_is_valid_expired_ttl(self):
+        cache = ForecastCache(ttl_minutes=-1)
+
+        response = MagicMock()
+        response.hourly.time = ["2030-01-01T00:00"]
+        cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+
+        assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is False
+
+    def test_is_valid_near_forecast_end(self):
+        cache = ForecastCache(ttl_minutes=60)
+
+        response = MagicMock()
+        response.hourly.time = ["2020-01-01T00:00"]
+        cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+
+        assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is False
+
+    def test_is_valid_uses_monotonic_deadline(self):
+        cache = ForecastCache(ttl_minutes=60)
+
+        response = MagicMock()
+        response.hourly.time = ["2100-01-01T00:00"]
+        with patch("openmeteo.cache.time.monotonic", return_value=1000.0):
+            cache.set(55.75, 37.62, TimeStep.HOURLY, response)
+            assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is True
+        with patch("openmeteo.cache.time.monotonic", return_value=1000.0 + 3601):
+            assert cache.is_valid(55.75, 37.62, TimeStep.HOURLY) is False
+
+    def test_expires_at_hourly_boundary(self):
+        cache = ForecastCache(ttl_policy="hourly_boundary")
+        fetched = datetime(2024, 1, 1, 10, 59, 30)
+
+        assert cache._expires_at(fetched, None) == datetime(2024, 1, 1, 11, 0)
+
+    def test_expires_at_adaptive(self):
+        cache = ForecastCache(ttl_minutes=60, ttl_policy="adaptive")
+        fetched = datetime(2024, 1, 1, 10, 0)
+
+        assert cache._expires_at(fetched, 1) == fetched + timedelta(minutes=30)
+        assert cache._expires_at(fetched, 7) == fetched + timedelta(minutes=60)
+        assert cache._expires_at(fetched, 14) == fetched + timedelta(minutes=120)
+        assert cache._expires_at(fetched, None) == fetched + timedelta(minutes=60)
+
+    def test_unsupported_ttl_policy(self):
+        with pytest.raises(ValueError, match="Unsupported TTL policy"):
+            ForecastCache(ttl_policy="sometimes")
+
     def test_clear(self):
         cache = ForecastCache()
 
@@ -405,11 +925,76 @@ class TestForecastCache:
         assert result is not None
 
 
+class TestBuildModel:
+    def test_builds_nested_models_without_validation(self):
+        data = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 0,
+            "timezone": "GMT",
+            "timezone_abbreviation": "GMT",
+            "hourly_units": {"time": "iso8601"},
+            "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5]},
+        }
+
+        response = _build_model(HourlyResponse, data)
+
+        assert isinstance(response.hourly, HourlyData)
+        assert isinstance(response.hourly_units, HourlyUnits)
+        assert response.hourly.temperature_2m == [5]
+        assert response.hourly.rain is None
+
+    def test_strict_mode_validates(self, monkeypatch):
+        monkeypatch.setenv("OPENMETEO_STRICT", "1")
+        with pytest.raises(ValidationError):
+            _build_model(HourlyData, {"time": "not-a-list"})
+
+
+class TestFrozenModels:
+    def test_response_fields_cannot_be_reassigned(self):
+        data = HourlyData(time=["2024-01-01T00:00"], temperature_2m=[1.0])
+
+        with pytest.raises(ValidationError):
+            data.temperature_2m = [2.0]
+
+    def test_model_copy_with_update(self):
+        data = HourlyData(time=["2024-01-01T00:00"], temperature_2m=[1.0])
+
+        updated = data.model_copy(update={"temperature_2m": [2.0]})
+
+        assert updated.temperature_2m == [2.0]
+        assert data.temperature_2m == [1.0]
+
+
+class TestLazyImports:
+    def test_import_does_not_load_client_or_models(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, openmeteo; "
+            "assert 'openmeteo.client' not in sys.modules; "
+            "assert 'openmeteo.models' not in sys.modules; "
+            "openmeteo.OpenMeteoClient; "
+            "assert 'openmeteo.client' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        import openmeteo
+
+        with pytest.raises(AttributeError):
+            openmeteo.NotAThing
+
+
 class TestExceptions:
     def test_api_error(self):
         error = OpenMeteoAPIError("Invalid parameter")
         assert error.reason == "Invalid parameter"
-        assert "Invalid parameter" in str(error)
+        assert str(error) == "API error: Invalid parameter"
+        assert error.args == ("Invalid parameter",)
 
     def test_validation_error(self):
         error = OpenMeteoValidationError("Invalid value")
@@ -440,6 +1025,18 @@ class TestClientLifecycle:
         assert c1 is c2
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_ensure_client_uses_pool_limits(self):
+        client = OpenMeteoClient(max_connections=10, max_keepalive=5)
+        with patch("openmeteo.client.httpx.AsyncClient") as mock_client_cls:
+            await client._ensure_client()
+
+        kwargs = mock_client_cls.call_args.kwargs
+        assert kwargs["limits"].max_connections == 10
+        assert kwargs["limits"].max_keepalive_connections == 5
+        assert kwargs["http2"] is False
+        assert kwargs["headers"]["user-agent"].startswith("openmeteo-py-df")
+
 
 class TestCacheManagement:
     def test_clear_forecast_cache(self):
@@ -455,44 +1052,85 @@ class TestCacheManagement:
         client.clear_forecast_cache()
         assert client._forecast_cache.get(55.75, 37.62, TimeStep.HOURLY) is None
 
-    def test_clear_historical_cache(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
-            client._historical_cache.save_month(
-                55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
-            )
+    def test_clear_historical_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+        client._historical_cache.save_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
+        )
 
-            client.clear_historical_cache()
+        client.clear_historical_cache()
 
-            result = client._historical_cache.load_month(
-                55.75, 37.62, TimeStep.HOURLY, "2024-01"
-            )
-            assert result is None
+        result = client._historical_cache.load_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01"
+        )
+        assert result is None
+        assert os.listdir(cache_dir) == ["historical"]
+
+    def test_clear_all_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+        client._historical_cache.save_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
+        )
 
-    def test_clear_all_cache(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
-            client._historical_cache.save_month(
-                55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
+        client.clear_all_cache()
+
+        assert client._forecast_cache.get(55.75, 37.62, TimeStep.HOURLY) is None
+        assert (
+            client._historical_cache.get_cached_months(
+                55.75, 37.62, TimeStep.HOURLY
             )
+            == set()
+        )
+
+    @pytest.mark.asyncio
+    async def test_aclear_historical_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+        client._historical_cache.save_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
+        )
+
+        await client.aclear_historical_cache()
+
+        result = client._historical_cache.load_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01"
+        )
+        assert result is None
+        assert client._historical_cache.cache_dir.is_dir()
+
+        await client.close()
+
+        assert client._cleanup_tasks == set()
+        assert os.listdir(cache_dir) == ["historical"]
+
+    @pytest.mark.asyncio
+    async def test_aclear_all_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+        client._historical_cache.save_month(
+            55.75, 37.62, TimeStep.HOURLY, "2024-01", {"test": 1}
+        )
+
+        await client.aclear_all_cache()
 
-            client.clear_all_cache()
+        assert client._forecast_cache.get(55.75, 37.62, TimeStep.HOURLY) is None
+        assert (
+            client._historical_cache.get_cached_months(
+                55.75, 37.62, TimeStep.HOURLY
+            )
+            == set()
+        )
 
-            assert client._forecast_cache.get(55.75, 37.62, TimeStep.HOURLY) is None
+        await client.close()
 
 
 class TestFetchMethod:
     @pytest.mark.asyncio
-    async def test_fetch_success(self):
+    async def test_fetch_success(self, http_response_factory):
         client = OpenMeteoClient()
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "latitude": 55.75,
-            "longitude": 37.62,
-            "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]},
-        }
-        mock_response.raise_for_status = MagicMock()
+        mock_response = http_response_factory(
+            b'{"latitude": 55.75, "longitude": 37.62, '
+            b'"hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]}}'
+        )
 
         with patch.object(client, "_ensure_client") as mock_ensure:
             mock_http_client = AsyncMock()
@@ -506,12 +1144,12 @@ class TestFetchMethod:
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_fetch_api_error(self):
+    async def test_fetch_api_error(self, http_response_factory):
         client = OpenMeteoClient()
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"error": True, "reason": "Invalid parameter"}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = http_response_factory(
+            b'{"error": true, "reason": "Invalid parameter"}'
+        )
 
         with patch.object(client, "_ensure_client") as mock_ensure:
             mock_http_client = AsyncMock()
@@ -524,208 +1162,534 @@ class TestFetchMethod:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_fetch_retries_transient_errors(self):
+        client = OpenMeteoClient()
+        statuses = [429, 503]
+
+        def handler(request):
+            if statuses:
+                return httpx.Response(statuses.pop(0), headers={"Retry-After": "2"})
+            return httpx.Response(200, json={"ok": True})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("openmeteo.client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            result = await client._fetch("https://example.com", {})
+
+        assert result == {"ok": True}
+        assert mock_sleep.await_count == 2
+        assert all(call.args[0] >= 2 for call in mock_sleep.await_args_list)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_caps_retry_after(self):
+        client = OpenMeteoClient(max_retries=1, backoff_base=0.5)
+        statuses = [503]
+
+        def handler(request):
+            if statuses:
+                return httpx.Response(
+                    statuses.pop(0), headers={"Retry-After": "3600"}
+                )
+            return httpx.Response(200, json={"ok": True})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("openmeteo.client.asyncio.sleep", AsyncMock()) as mock_sleep:
+            await client._fetch("https://example.com", {})
+
+        assert 1.0 <= mock_sleep.await_args.args[0] <= 1.25
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_gives_up_after_max_retries(self):
+        client = OpenMeteoClient(max_retries=2)
+        attempts = 0
+
+        def handler(request):
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(503, headers={"Retry-After": "soon"})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("openmeteo.client.asyncio.sleep", AsyncMock()):
+            with pytest.raises(OpenMeteoConnectionError):
+                await client._fetch("https://example.com", {})
+
+        assert attempts == 3
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_does_not_retry_client_errors(self):
+        client = OpenMeteoClient()
+        attempts = 0
+
+        def handler(request):
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(404)
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(OpenMeteoConnectionError):
+            await client._fetch("https://example.com", {})
+
+        assert attempts == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_coalesces_identical_requests(self):
+        client = OpenMeteoClient()
+        calls = 0
+
+        async def fake_request(url, params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": params["a"]}
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            same = await asyncio.gather(
+                client._fetch("https://example.com", {"a": 1, "b": 2}),
+                client._fetch("https://example.com", {"b": 2, "a": 1}),
+            )
+            other = await client._fetch("https://example.com", {"a": 3})
+
+        assert calls == 2
+        assert same[0] is same[1]
+        assert other == {"value": 3}
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_coalesced_error_reaches_all_callers(self):
+        client = OpenMeteoClient()
+
+        async def fake_request(url, params):
+            await asyncio.sleep(0.01)
+            raise OpenMeteoConnectionError("boom")
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            results = await asyncio.gather(
+                client._fetch("https://example.com", {}),
+                client._fetch("https://example.com", {}),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, OpenMeteoConnectionError) for r in results)
+        assert client._inflight == {}
+
 
 class TestGetForecast:
     @pytest.mark.asyncio
-    async def test_get_forecast_returns_hourly(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_forecast_returns_hourly(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
-            mock_response = {
-                "latitude": 55.75,
-                "longitude": 37.62,
-                "elevation": 130.0,
-                "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
-                "hourly_units": {"time": "iso8601"},
-                "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]},
-            }
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "hourly_units": {"time": "iso8601"},
+            "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]},
+        }
 
-            with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
-                result = await client.get_forecast(
-                    55.75, 37.62, days=7, step=TimeStep.HOURLY
-                )
+        mock_fetch = AsyncMock(return_value=mock_response)
+        with patch.object(client, "_fetch", mock_fetch):
+            result = await client.get_forecast(
+                55.75, 37.62, days=7, step=TimeStep.HOURLY
+            )
+
+            assert isinstance(result, HourlyResponse)
 
-                assert isinstance(result, HourlyResponse)
+        params = mock_fetch.call_args.args[1]
+        assert params["hourly"] == ",".join(HOURLY_VARIABLES)
 
-            await client.close()
+        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_forecast_returns_daily(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_forecast_returns_daily(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
-            mock_response = {
-                "latitude": 55.75,
-                "longitude": 37.62,
-                "elevation": 130.0,
-                "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
-                "daily_units": {"time": "iso8601"},
-                "daily": {"time": ["2024-01-01"], "temperature_2m_max": [5.0]},
-            }
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "daily_units": {"time": "iso8601"},
+            "daily": {"time": ["2024-01-01"], "temperature_2m_max": [5.0]},
+        }
 
-            with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
-                result = await client.get_forecast(
-                    55.75, 37.62, days=7, step=TimeStep.DAILY
-                )
+        with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
+            result = await client.get_forecast(
+                55.75, 37.62, days=7, step=TimeStep.DAILY
+            )
 
-                assert isinstance(result, DailyResponse)
+            assert isinstance(result, DailyResponse)
 
-            await client.close()
+        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_forecast_uses_cache(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_forecast_uses_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
-            mock_response = {
-                "latitude": 55.75,
-                "longitude": 37.62,
-                "elevation": 130.0,
-                "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
-                "hourly_units": {"time": "iso8601"},
-                "hourly": {"time": ["2030-01-01T00:00"], "temperature_2m": [5.0]},
-            }
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "hourly_units": {"time": "iso8601"},
+            "hourly": {"time": ["2030-01-01T00:00"], "temperature_2m": [5.0]},
+        }
+
+        mock_fetch = AsyncMock(return_value=mock_response)
+        with patch.object(client, "_fetch", mock_fetch):
+            first = await client.get_forecast(
+                55.75, 37.62, days=7, step=TimeStep.HOURLY
+            )
+            mock_fetch.assert_called_once()
+
+            mock_fetch.reset_mock()
+            second = await client.get_forecast(
+                55.75, 37.62, days=7, step=TimeStep.HOURLY
+            )
+            mock_fetch.assert_not_called()
+
+        assert second is first
 
-            mock_fetch = AsyncMock(return_value=mock_response)
-            with patch.object(client, "_fetch", mock_fetch):
-                await client.get_forecast(55.75, 37.62, days=7, step=TimeStep.HOURLY)
-                mock_fetch.assert_called_once()
+        with patch.object(client, "_fetch", mock_fetch):
+            nearby = await client.get_forecast(
+                55.750001, 37.620001, days=7, step=TimeStep.HOURLY
+            )
+            mock_fetch.assert_not_called()
 
-                mock_fetch.reset_mock()
-                await client.get_forecast(55.75, 37.62, days=7, step=TimeStep.HOURLY)
-                mock_fetch.assert_not_called()
+        assert nearby is first
 
-            await client.close()
+        await client.close()
 
 
 class TestGetCurrent:
     @pytest.mark.asyncio
-    async def test_get_current_returns_response(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_current_returns_response(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
-            mock_response = {
-                "latitude": 55.75,
-                "longitude": 37.62,
-                "elevation": 130.0,
-                "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
-                "current_units": {"time": "iso8601", "interval": "seconds"},
-                "current": {
-                    "time": "2024-01-01T12:00",
-                    "interval": 3600,
-                    "temperature_2m": -5.0,
-                },
-            }
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "current_units": {"time": "iso8601", "interval": "seconds"},
+            "current": {
+                "time": "2024-01-01T12:00",
+                "interval": 3600,
+                "temperature_2m": -5.0,
+            },
+        }
 
-            with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
-                result = await client.get_current(55.75, 37.62)
+        with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
+            result = await client.get_current(55.75, 37.62)
 
-                assert isinstance(result, CurrentResponse)
-                assert result.current.temperature_2m == -5.0
+            assert isinstance(result, CurrentResponse)
+            assert result.current.temperature_2m == -5.0
 
-            await client.close()
+        await client.close()
 
 
 class TestGetHistorical:
     @pytest.mark.asyncio
-    async def test_get_historical_returns_hourly(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_historical_returns_hourly(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
-            mock_response = {
-                "latitude": 55.75,
-                "longitude": 37.62,
-                "elevation": 130.0,
-                "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
-                "hourly_units": {"time": "iso8601"},
-                "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]},
-            }
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "hourly_units": {"time": "iso8601"},
+            "hourly": {"time": ["2024-01-01T00:00"], "temperature_2m": [5.0]},
+        }
+
+        with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
+            result = await client.get_historical(
+                55.75,
+                37.62,
+                date(2024, 1, 1),
+                date(2024, 1, 1),
+                step=TimeStep.HOURLY,
+            )
+
+            assert isinstance(result, HourlyResponse)
+
+        await client.close()
 
-            with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
-                result = await client.get_historical(
+    @pytest.mark.asyncio
+    async def test_get_historical_returns_daily(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "daily_units": {"time": "iso8601"},
+            "daily": {"time": ["2024-01-01"], "temperature_2m_max": [5.0]},
+        }
+
+        with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
+            result = await client.get_historical(
+                55.75,
+                37.62,
+                date(2024, 1, 1),
+                date(2024, 1, 1),
+                step=TimeStep.DAILY,
+            )
+
+            assert isinstance(result, DailyResponse)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_historical_saves_months_before_raising(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+
+        january = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "daily_units": {"time": "iso8601"},
+            "daily": {"time": ["2024-01-01"], "temperature_2m_max": [5.0]},
+        }
+
+        async def fake_fetch(url, params):
+            if params["start_date"].startswith("2024-02"):
+                raise OpenMeteoConnectionError("boom")
+            return january
+
+        with patch.object(client, "_fetch", side_effect=fake_fetch):
+            with pytest.raises(OpenMeteoConnectionError):
+                await client.get_historical(
                     55.75,
                     37.62,
                     date(2024, 1, 1),
-                    date(2024, 1, 1),
-                    step=TimeStep.HOURLY,
+                    date(2024, 2, 10),
+                    step=TimeStep.DAILY,
                 )
 
-                assert isinstance(result, HourlyResponse)
+        assert client._historical_cache.get_cached_months(
+            55.75, 37.62, TimeStep.DAILY
+        ) == {"2024-01"}
 
-            await client.close()
+        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_historical_returns_daily(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_historical_uses_cache(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "daily_units": {"time": "iso8601"},
+            "daily": {
+                "time": ["2024-01-01", "2024-01-02"],
+                "temperature_2m_max": [5.0, 6.0],
+            },
+        }
+
+        mock_fetch = AsyncMock(return_value=mock_response)
+        with patch.object(client, "_fetch", mock_fetch):
+            await client.get_historical(
+                55.75, 37.62, date(2024, 1, 1), date(2024, 1, 2), TimeStep.DAILY
+            )
+            mock_fetch.assert_called_once()
+
+            mock_fetch.reset_mock()
+            result = await client.get_historical(
+                55.75, 37.62, date(2024, 1, 2), date(2024, 1, 2), TimeStep.DAILY
+            )
+            mock_fetch.assert_not_called()
+
+        assert result.daily.time == ["2024-01-02"]
+        assert result.daily.temperature_2m_max == [6.0]
 
-            mock_response = {
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_historical_result_does_not_share_cached_lists(
+        self, cache_dir
+    ):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+
+        mock_response = {
+            "latitude": 55.75,
+            "longitude": 37.62,
+            "elevation": 130.0,
+            "generationtime_ms": 0.5,
+            "utc_offset_seconds": 10800,
+            "timezone": "Europe/Moscow",
+            "timezone_abbreviation": "MSK",
+            "daily_units": {"time": "iso8601"},
+            "daily": {
+                "time": ["2024-01-01", "2024-01-02"],
+                "temperature_2m_max": [1.0, 2.0],
+            },
+        }
+
+        with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
+            first = await client.get_historical(
+                55.75, 37.62, date(2024, 1, 1), date(2024, 1, 2), TimeStep.DAILY
+            )
+            first.daily.temperature_2m_max[0] = 999.0
+
+            untrimmed = await client.get_historical(
+                55.75,
+                37.62,
+                date(2024, 1, 1),
+                date(2024, 1, 2),
+                TimeStep.DAILY,
+                trim_to_range=False,
+            )
+            untrimmed.daily.temperature_2m_max[0] = 999.0
+
+            result = await client.get_historical(
+                55.75, 37.62, date(2024, 1, 1), date(2024, 1, 2), TimeStep.DAILY
+            )
+
+        assert result.daily.temperature_2m_max == [1.0, 2.0]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_historical_fetches_months_concurrently(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(url, params):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            day = params["start_date"]
+            # Later months finish first to check the merge order.
+            await asyncio.sleep(0.01 * (13 - int(day[5:7])))
+            in_flight -= 1
+            return {
                 "latitude": 55.75,
                 "longitude": 37.62,
                 "elevation": 130.0,
                 "generationtime_ms": 0.5,
-                "utc_offset_seconds": 10800,
-                "timezone": "Europe/Moscow",
-                "timezone_abbreviation": "MSK",
+                "utc_offset_seconds": 0,
+                "timezone": "GMT",
+                "timezone_abbreviation": "GMT",
                 "daily_units": {"time": "iso8601"},
-                "daily": {"time": ["2024-01-01"], "temperature_2m_max": [5.0]},
+                "daily": {"time": [day], "temperature_2m_max": [float(day[5:7])]},
             }
 
-            with patch.object(client, "_fetch", AsyncMock(return_value=mock_response)):
-                result = await client.get_historical(
-                    55.75,
-                    37.62,
-                    date(2024, 1, 1),
-                    date(2024, 1, 1),
-                    step=TimeStep.DAILY,
-                )
+        with patch.object(client, "_fetch", side_effect=fake_fetch):
+            result = await client.get_historical(
+                55.75, 37.62, date(2024, 1, 1), date(2024, 3, 31), TimeStep.DAILY
+            )
+
+        assert max_in_flight == 3
+        assert result.daily.time == ["2024-01-01", "2024-02-01", "2024-03-01"]
+        assert result.daily.temperature_2m_max == [1.0, 2.0, 3.0]
+        assert client._historical_cache.get_cached_months(
+            55.75, 37.62, TimeStep.DAILY
+        ) == {"2024-01", "2024-02", "2024-03"}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_historical_respects_max_concurrent_requests(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir, max_concurrent_requests=1)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(url, params):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {
+                "latitude": 55.75,
+                "longitude": 37.62,
+                "elevation": 130.0,
+                "generationtime_ms": 0.5,
+                "utc_offset_seconds": 0,
+                "timezone": "GMT",
+                "timezone_abbreviation": "GMT",
+                "daily_units": {"time": "iso8601"},
+                "daily": {"time": [params["start_date"]]},
+            }
 
-                assert isinstance(result, DailyResponse)
+        with patch.object(client, "_fetch", side_effect=fake_fetch):
+            await client.get_historical(
+                55.75,
+                37.62,
+                date(2024, 1, 1),
+                date(2024, 3, 31),
+                TimeStep.DAILY,
+                trim_to_range=False,
+            )
+
+        assert max_in_flight == 1
 
-            await client.close()
+        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_historical_empty_response(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            client = OpenMeteoClient(cache_dir=Path(tmpdir))
+    async def test_get_historical_empty_response(self, cache_dir):
+        client = OpenMeteoClient(cache_dir=cache_dir)
 
+        with patch.object(
+            client, "_fetch", AsyncMock(side_effect=Exception("No data"))
+        ):
             with patch.object(
-                client, "_fetch", AsyncMock(side_effect=Exception("No data"))
+                client._historical_cache,
+                "get_missing_months",
+                return_value=[],
             ):
                 with patch.object(
                     client._historical_cache,
-                    "get_missing_months",
-                    return_value=[],
+                    "get_cached_months",
+                    return_value=set(),
                 ):
-                    with patch.object(
-                        client._historical_cache,
-                        "get_cached_months",
-                        return_value=set(),
-                    ):
-                        result = await client.get_historical(
-                            55.75,
-                            37.62,
-                            date(2024, 1, 1),
-                            date(2024, 1, 1),
-                            step=TimeStep.HOURLY,
-                        )
-
-                        assert isinstance(result, HourlyResponse)
-                        assert len(result.hourly.time) == 0
-
-            await client.close()
+                    result = await client.get_historical(
+                        55.75,
+                        37.62,
+                        date(2024, 1, 1),
+                        date(2024, 1, 1),
+                        step=TimeStep.HOURLY,
+                    )
+
+                    assert isinstance(result, HourlyResponse)
+                    assert len(result.hourly.time) == 0
+
+        await client.close()
@@ -1,3 +1,5 @@
+import importlib.util
+
 import pytest
 from datetime import date
 from unittest.mock import MagicMock
@@ -14,10 +16,14 @@ from openmeteo.models import (
     CurrentUnits,
 )
 
+requires_pandas = pytest.mark.skipif(
+    importlib.util.find_spec("pandas") is None, reason="pandas is not installed"
+)
+
 
+@requires_pandas
 class TestToDataframeHourly:
     def test_to_dataframe_hourly(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
 
         response = HourlyResponse(
@@ -44,7 +50,6 @@ class TestToDataframeHourly:
         assert df["temperature_2m"].tolist() == [-5.0, -4.5]
 
     def test_to_dataframe_converts_time_to_datetime(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
         import pandas as pd
 
@@ -66,10 +71,76 @@ class TestToDataframeHourly:
 
         assert pd.api.types.is_datetime64_any_dtype(df["time"])
 
+    def test_to_dataframe_column_dtypes(self):
+        from openmeteo.dataframe import to_dataframe
+
+        response = HourlyResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            hourly_units=HourlyUnits(),
+            hourly=HourlyData(
+                time=["2024-01-01T00:00", "2024-01-01T01:00"],
+                temperature_2m=[-5.0, None],
+                weather_code=[3, None],
+            ),
+        )
+
+        df = to_dataframe(response)
+
+        assert str(df["time"].dtype) == "datetime64[ns]"
+        assert str(df["temperature_2m"].dtype) == "float64"
+        assert df["temperature_2m"].isna().tolist() == [False, True]
+        assert str(df["weather_code"].dtype) == "Int64"
+        assert df["weather_code"].isna().tolist() == [False, True]
+        assert df["rain"].isna().all()
+
+    def test_to_dataframe_keeps_all_columns_for_partial_data(self):
+        from openmeteo.dataframe import to_dataframe
+
+        response = HourlyResponse.model_construct(
+            hourly=HourlyData.model_construct(
+                time=["2024-01-01T00:00"], temperature_2m=[-5.0]
+            ),
+        )
+
+        df = to_dataframe(response)
+
+        assert list(df.columns) == list(HourlyData.model_fields)
+        assert df["temperature_2m"].tolist() == [-5.0]
+        assert df["snowfall"].isna().all()
+        assert str(df["weather_code"].dtype) == "Int64"
+
+    def test_to_dataframe_accepts_response_subclass(self):
+        from openmeteo.dataframe import to_dataframe
+
+        class CustomHourlyResponse(HourlyResponse):
+            pass
+
+        response = CustomHourlyResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            hourly_units=HourlyUnits(),
+            hourly=HourlyData(time=["2024-01-01T00:00"], temperature_2m=[-5.0]),
+        )
+
+        df = to_dataframe(response)
+
+        assert df["temperature_2m"].tolist() == [-5.0]
+
 
+@requires_pandas
 class TestToDataframeDaily:
     def test_to_dataframe_daily(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
 
         response = DailyResponse(
@@ -95,7 +166,6 @@ class TestToDataframeDaily:
         assert df["temperature_2m_max"].tolist() == [-2.0, -1.0]
 
     def test_to_dataframe_daily_sunrise_sunset(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
         import pandas as pd
 
@@ -120,11 +190,40 @@ class TestToDataframeDaily:
         assert pd.api.types.is_datetime64_any_dtype(df["sunrise"])
         assert pd.api.types.is_datetime64_any_dtype(df["sunset"])
 
+    def test_to_dataframe_daily_parses_dates_and_missing_sunset(self):
+        from openmeteo.dataframe import to_dataframe
+        import pandas as pd
+
+        response = DailyResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            daily_units=DailyUnits(),
+            daily=DailyData(
+                time=["2024-01-01", "2024-01-02"],
+                sunrise=["2024-01-01T07:30", "2024-01-02T07:29"],
+            ),
+        )
 
+        df = to_dataframe(response)
+
+        assert df["time"].tolist() == [
+            pd.Timestamp("2024-01-01"),
+            pd.Timestamp("2024-01-02"),
+        ]
+        assert df["sunrise"].iloc[0] == pd.Timestamp("2024-01-01 07:30")
+        assert df["sunset"].isna().all()
+
+
+@requires_pandas
 class TestToDataframeCurrent:
     def test_to_dataframe_current(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
+        import pandas as pd
 
         response = CurrentResponse(
             latitude=55.75,
@@ -148,11 +247,224 @@ class TestToDataframeCurrent:
         assert df.shape[0] == 1
         assert "temperature_2m" in df.columns
         assert df["temperature_2m"].iloc[0] == -5.0
+        assert str(df["time"].dtype) == "datetime64[ns]"
+        assert df["time"].iloc[0] == pd.Timestamp("2024-01-01 12:00")
+        assert str(df["temperature_2m"].dtype) == "float64"
+        assert str(df["relative_humidity_2m"].dtype) == "Int64"
+        assert str(df["rain"].dtype) == "float64"
+        assert df["rain"].isna().all()
+
+
+class TestParseIso:
+    def test_parses_strings(self):
+        np = pytest.importorskip("numpy")
+        from openmeteo.dataframe import _parse_iso
+
+        result = _parse_iso(["2024-01-01T06:30", "2024-01-02", None])
+
+        assert result.dtype == np.dtype("datetime64[ns]")
+        assert result[0] == np.datetime64("2024-01-01T06:30")
+        assert result[1] == np.datetime64("2024-01-02")
+        assert np.isnat(result[2])
+
+    def test_keeps_seconds(self):
+        np = pytest.importorskip("numpy")
+        from openmeteo.dataframe import _parse_iso
+
+        result = _parse_iso(["2024-01-01T06:30:30"])
+
+        assert result.dtype == np.dtype("datetime64[ns]")
+        assert result[0] == np.datetime64("2024-01-01T06:30:30")
+
+    @requires_pandas
+    def test_offset_strings_fall_back_to_pandas(self):
+        import pandas as pd
+        from openmeteo.dataframe import _parse_iso
+
+        result = _parse_iso(["2024-01-01T06:30+03:00", None])
+
+        assert str(result.tz) == "UTC+03:00"
+        assert result[0] == pd.Timestamp("2024-01-01T06:30+03:00")
+        assert pd.isna(result[1])
+
+    def test_datetime64_input_is_not_reparsed(self):
+        np = pytest.importorskip("numpy")
+        from openmeteo.dataframe import _parse_iso
+
+        times = np.array(["2024-01-01T00:00"], dtype="datetime64[ns]")
+
+        assert _parse_iso(times) is times
+        assert _parse_iso(times.astype("datetime64[m]")).dtype == times.dtype
+
+
+@requires_pandas
+class TestToDataframeMany:
+    @staticmethod
+    def _hourly(latitude, hourly):
+        return HourlyResponse(
+            latitude=latitude,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            hourly_units=HourlyUnits(),
+            hourly=hourly,
+        )
+
+    def test_concatenates_responses(self):
+        from openmeteo.dataframe import to_dataframe, to_dataframe_many
+        import pandas as pd
+
+        first = self._hourly(
+            55.75,
+            HourlyData(
+                time=["2024-01-01T00:00", "2024-01-01T01:00"],
+                temperature_2m=[-5.0, -4.5],
+                weather_code=[3, 1],
+            ),
+        )
+        second = self._hourly(
+            59.94,
+            HourlyData(time=["2024-01-01T00:00"], temperature_2m=[-7.0]),
+        )
+
+        df = to_dataframe_many([first, second])
+
+        assert df["location_id"].tolist() == [0, 0, 1]
+        assert df["temperature_2m"].tolist() == [-5.0, -4.5, -7.0]
+        assert df["weather_code"].isna().tolist() == [False, False, True]
+        expected = pd.concat(
+            [to_dataframe(first), to_dataframe(second)], ignore_index=True
+        )
+        pd.testing.assert_frame_equal(df.drop(columns="location_id"), expected)
+
+    def test_without_location(self):
+        from openmeteo.dataframe import to_dataframe_many
+
+        response = self._hourly(55.75, HourlyData(time=["2024-01-01T00:00"]))
+
+        df = to_dataframe_many([response], add_location=False)
+
+        assert "location_id" not in df.columns
+        assert df.shape[0] == 1
+
+    def test_empty(self):
+        from openmeteo.dataframe import to_dataframe_many
+
+        assert to_dataframe_many([]).empty
+
+    def test_rejects_mixed_steps(self):
+        from openmeteo.dataframe import to_dataframe_many
+
+        hourly = self._hourly(55.75, HourlyData(time=["2024-01-01T00:00"]))
+        daily = DailyResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            daily_units=DailyUnits(),
+            daily=DailyData(time=["2024-01-01"]),
+        )
+
+        with pytest.raises(ValueError):
+            to_dataframe_many([hourly, daily])
+        with pytest.raises(ValueError) as exc_info:
+            to_dataframe_many([hourly, "not a response"])
+        assert "Unsupported response type" in str(exc_info.value)
+
+
+class TestToArrow:
+    @staticmethod
+    def _hourly():
+        return HourlyResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            hourly_units=HourlyUnits(),
+            hourly=HourlyData(
+                time=["2024-01-01T00:00", "2024-01-01T01:00"],
+                temperature_2m=[-5.0, None],
+                weather_code=[3, 1],
+            ),
+        )
+
+    def test_to_arrow_hourly(self):
+        pa = pytest.importorskip("pyarrow")
+        from openmeteo.dataframe import to_arrow
+
+        table = to_arrow(self._hourly())
+
+        assert table.num_rows == 2
+        assert table.schema.field("time").type == pa.timestamp("ns")
+        assert table.schema.field("temperature_2m").type == pa.float64()
+        assert table.schema.field("weather_code").type == pa.int64()
+        assert table.column("temperature_2m").to_pylist() == [-5.0, None]
+        assert table.column("rain").null_count == 2
+
+    def test_to_arrow_current(self):
+        pa = pytest.importorskip("pyarrow")
+        from openmeteo.dataframe import to_arrow
+
+        response = CurrentResponse(
+            latitude=55.75,
+            longitude=37.62,
+            elevation=130.0,
+            generationtime_ms=0.5,
+            utc_offset_seconds=10800,
+            timezone="Europe/Moscow",
+            timezone_abbreviation="MSK",
+            current_units=CurrentUnits(),
+            current=CurrentData(
+                time="2024-01-01T12:00", interval=3600, temperature_2m=-5.0
+            ),
+        )
+
+        table = to_arrow(response)
+
+        assert table.num_rows == 1
+        assert table.schema.field("time").type == pa.timestamp("ns")
+        assert table.column("temperature_2m").to_pylist() == [-5.0]
+
+    def test_to_parquet_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        from openmeteo.dataframe import to_arrow, to_parquet
+
+        response = self._hourly()
+        path = tmp_path / "hourly.parquet"
+        to_parquet(response, path)
+        assert pq.read_table(path).equals(to_arrow(response))
+
+    def test_to_arrow_rejects_unsupported_type(self):
+        pytest.importorskip("pyarrow")
+        from openmeteo.dataframe import to_arrow
+
+        with pytest.raises(ValueError):
+            to_arrow("not a response")
+
+    def test_raises_without_pyarrow(self):
+        import openmeteo.dataframe as dataframe_module
+
+        if dataframe_module._PYARROW_OK:
+            pytest.skip("pyarrow is installed")
+
+        with pytest.raises(ImportError) as exc_info:
+            dataframe_module.to_arrow(self._hourly())
+        assert "pyarrow is required" in str(exc_info.value)
 
 
 class TestToDataframeErrors:
+    @requires_pandas
     def test_raises_on_unsupported_type(self):
-        pytest.importorskip("pandas")
         from openmeteo.dataframe import to_dataframe
 
         with pytest.raises(ValueError) as exc_info:
@@ -163,11 +475,13 @@ class TestToDataframeErrors:
         import sys
         import importlib
 
+        import openmeteo.dataframe as dataframe_module
+
         original_pandas = sys.modules.get("pandas")
         sys.modules["pandas"] = None
 
         try:
-            from openmeteo.dataframe import to_dataframe
+            importlib.reload(dataframe_module)
 
             response = HourlyResponse(
                 latitude=55.75,
@@ -182,10 +496,11 @@ class TestToDataframeErrors:
             )
 
             with pytest.raises(ImportError) as exc_info:
-                to_dataframe(response)
+                dataframe_module.to_dataframe(response)
             assert "pandas is required" in str(exc_info.value)
         finally:
             if original_pandas is not None:
                 sys.modules["pandas"] = original_pandas
             else:
                 del sys.modules["pandas"]
+            importlib.reload(dataframe_module)